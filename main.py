@@ -125,21 +125,22 @@ class MusicApp(Gtk.Application):
             "playlist_tracks_selection", "playlist_tracks_view", "favorites_tracks_store", "favorites_tracks_sort_model",
             "favorites_tracks_selection", "favorites_tracks_view", "favorites_status_label", "current_artist", "current_album", "current_playlist", "playback_album",
             "playback_track_info", "playback_track_identity", "playback_track_index", "playback_queue_identity", "playback_last_tick",
-            "playback_pending_since", "playback_timer_id", "playback_time_current_label", "playback_time_total_label",
+            "playback_pending_since", "playback_timer_id", "_last_rendered_elapsed_s",
+            "_last_rendered_duration_s", "_last_rendered_fraction_q", "_album_identity_index", "_highlighted_row", "_pending_seek_position", "_pending_seek_source", "_playback_snapshot_source", "_now_playing_image_cache", "playback_time_current_label", "playback_time_total_label",
             "now_playing_title_button", "now_playing_title_label", "now_playing_artist_button", "now_playing_artist_label",
             "now_playing_quality_label", "now_playing_provider_box", "now_playing_provider_icon", "now_playing_provider_label",
             "now_playing_art_thumb", "now_playing_art_thumb_url",
             "play_pause_button", "play_pause_image", "playback_sync_id",
             "_playback_listener_thread", "_playback_listener_stop", "_playback_listener_server",
             "previous_button", "next_button", "volume_slider", "mute_button", "mute_button_image", "eq_button", "volume_update_id",
-            "last_volume_value", "pending_volume_value", "output_menu_button", "output_popover", "output_targets_list", "sendspin_pipeline_teardown_id",
+            "last_volume_value", "pending_volume_value", "output_menu_button", "output_popover", "output_targets_list", "_output_row_handler_id", "sendspin_pipeline_teardown_id",
             "output_status_label", "output_label", "_last_sendspin_local_output_id", "output_manager", "media3_eq_manager",
             "search_entry", "search_scope_toggle", "search_results_view", "search_status_label", "search_playlists_section",
             "search_playlists_flow", "search_albums_section", "search_albums_flow", "search_artists_section",
             "search_artists_list", "search_tracks_section", "search_tracks_store", "search_tracks_sort_model",
             "search_tracks_selection", "search_tracks_view", "search_tracks_scroller", "search_previous_view",
             "search_previous_album", "search_previous_album_tracks", "search_context_album", "search_debounce_id",
-            "search_request_id", "client_session", "provider_manifests", "provider_instances", "provider_icon_cache",
+            "search_request_id", "client_session", "provider_manifests", "provider_instances",
             "_library_refresh_source_id", "albums_refresh_button", "artists_refresh_button",
             "album_sort_button", "output_group_players_box", "output_group_rows",
             "queue_list", "queue_panel_view", "queue_status_label", "queue_panel_button", "queue_clear_button",
@@ -160,8 +161,8 @@ class MusicApp(Gtk.Application):
             "library_loading", "playlists_loading", "playlists_refresh_pending", "home_recently_played_loading",
             "home_recently_added_loading", "home_recently_played_tracks_loading", "home_recommendations_loading",
             "favorites_loading", "track_bind_logged", "playback_remote_active", "auto_load_attempted",
-            "volume_dragging", "seek_dragging", "suppress_volume_changes", "suppress_track_selection", "suppress_output_selection", "suppress_bitperfect_sync", "playback_sync_inflight",
-            "playback_pending", "provider_manifest_loading",
+            "volume_dragging", "seek_dragging", "suppress_volume_changes", "suppress_track_selection", "suppress_bitperfect_sync", "playback_sync_inflight",
+            "playback_pending", "provider_manifest_loading", "_dirty_scheduled",
             "_resume_after_sendspin_connect", "search_loading", "search_active", "repeat_request_inflight",
             "shuffle_request_inflight", "_library_refresh_pending", "album_filter_favorite_only",
             "queue_loading", "queue_clearing", "queue_transferring", "output_group_populating",
@@ -181,7 +182,7 @@ class MusicApp(Gtk.Application):
         self.favorites_track_rows = []
         self.provider_manifests = {}
         self.provider_instances = {}
-        self.provider_icon_cache = {}
+        self.provider_manifest_by_any_key = {}
         self.albums_scroll_position = 0.0
         self.album_sort_order = "sort_name"
         self.sidebar_width = SIDEBAR_WIDTH
@@ -194,6 +195,7 @@ class MusicApp(Gtk.Application):
         self.search_provider_filter_bar = None
         self._raw_search_results = None
         self.grouped_player_ids = set()
+        self._dirty = set()
         self.library_albums = []
         self.library_artists = []
         self.playlists = []
@@ -490,6 +492,8 @@ class MusicApp(Gtk.Application):
         self.audio_pipeline.destroy_pipeline()
         if self.media3_eq_manager:
             self.media3_eq_manager.release()
+        if self.output_manager:
+            self.output_manager.close()
         if self.client_session:
             self.client_session.stop()
         if self.mpris_manager:
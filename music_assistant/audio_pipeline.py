@@ -51,6 +51,7 @@ class AudioPipeline:
         self._get_supported_formats = get_supported_formats or (lambda: [])
         self.pipeline: Gst.Pipeline | None = None
         self.appsrc: Gst.Element | None = None
+        self.active = False
         self.volume_element: Gst.Element | None = None
         self.eq_element: Gst.Element | None = None
         self.stream_format: PCMFormat | None = None
@@ -91,7 +92,7 @@ class AudioPipeline:
         return best
 
     def is_active(self) -> bool:
-        return bool(self.pipeline and self.appsrc)
+        return self.active
 
     def create_pipeline(
         self,
@@ -231,6 +232,7 @@ class AudioPipeline:
         pipeline.set_state(Gst.State.PLAYING)
         self.pipeline = pipeline
         self.appsrc = appsrc
+        self.active = True
         self.volume_element = volume_element
         self.eq_element = eq_element
         self.stream_format = format_info
@@ -298,6 +300,7 @@ class AudioPipeline:
         pipeline.set_state(Gst.State.PLAYING)
         self.pipeline = pipeline
         self.appsrc = appsrc
+        self.active = True
         self.stream_format = format_info
         self.stream_start_ts = None
         self.last_pts_ns = None
@@ -320,6 +323,7 @@ class AudioPipeline:
         self.pipeline.set_state(Gst.State.NULL)
         self.pipeline = None
         self.appsrc = None
+        self.active = False
         self.volume_element = None
         self.eq_element = None
         self._bitperfect = False
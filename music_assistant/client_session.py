@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import logging
 import threading
 from typing import Awaitable, Callable, TypeVar
@@ -67,8 +68,24 @@ class ClientSession:
         *args: object,
         **kwargs: object,
     ) -> T:
+        return self.submit(
+            server_url,
+            auth_token,
+            coro_func,
+            *args,
+            **kwargs,
+        ).result()
+
+    def submit(
+        self,
+        server_url: str,
+        auth_token: str,
+        coro_func: Callable[..., Awaitable[T]],
+        *args: object,
+        **kwargs: object,
+    ) -> concurrent.futures.Future[T]:
         self._ensure_loop()
-        future = asyncio.run_coroutine_threadsafe(
+        return asyncio.run_coroutine_threadsafe(
             self._run_with_client(
                 server_url,
                 auth_token,
@@ -78,7 +95,6 @@ class ClientSession:
             ),
             self._loop,
         )
-        return future.result()
 
     def set_server(self, server_url: str, auth_token: str) -> None:
         self._ensure_loop()
@@ -10,6 +10,12 @@ from music_assistant import playback, sendspin
 from music_assistant_models.enums import PlaybackState
 from ui import ui_utils
 
+_logger = logging.getLogger(__name__)
+
+
+def _row_key(player_id: str, local_output_id: str | None) -> str:
+    return f"{player_id}\x00{local_output_id}"
+
 
 def on_output_popover_mapped(app, _popover: Gtk.Popover) -> None:
     app.sendspin_manager.start(app.server_url)
@@ -17,7 +23,7 @@ def on_output_popover_mapped(app, _popover: Gtk.Popover) -> None:
 
 
 def on_output_target_activated(app, _listbox: Gtk.ListBox, row) -> None:
-    if app.suppress_output_selection or row is None:
+    if row is None:
         return
     previous = app.output_manager.get_selected_output()
     previous_player_id = previous.get("player_id") if previous else None
@@ -126,20 +132,27 @@ def _apply_outputs_changed(app) -> None:
         row.set_child(row_content)
         row.display_name = output["display_name"]
         app.output_targets_list.append(row)
-        app.output_target_rows[(row.player_id, row.local_output_id)] = row
+        app.output_target_rows[_row_key(player_id, local_output_id)] = row
 
     _populate_group_players_list(app, unique_outputs)
 
     selected = app.output_manager.get_selected_output()
     if not selected:
         return
-    key = (selected["player_id"], selected["local_output_id"])
-    row = app.output_target_rows.get(key)
+    row = app.output_target_rows.get(
+        _row_key(selected["player_id"], selected["local_output_id"])
+    )
     if not row:
         return
-    app.suppress_output_selection = True
-    app.output_targets_list.select_row(row)
-    app.suppress_output_selection = False
+    handler_id = app._output_row_handler_id
+    if handler_id is None:
+        app.output_targets_list.select_row(row)
+        return
+    app.output_targets_list.handler_block(handler_id)
+    try:
+        app.output_targets_list.select_row(row)
+    finally:
+        app.output_targets_list.handler_unblock(handler_id)
 
 
 def on_output_selected(app) -> None:
@@ -172,7 +185,7 @@ def _apply_output_selected(app) -> None:
     if getattr(app, "output_bitperfect", False):
         local_output = app.output_manager.get_preferred_local_output()
         if local_output is None or not local_output.get("is_bitperfect_capable"):
-            logging.getLogger(__name__).warning(
+            _logger.warning(
                 "Bit-perfect mode is enabled but selected output '%s' does not support it; "
                 "falling back to standard pipeline.",
                 local_output["name"] if local_output else "System Default",
@@ -194,12 +207,12 @@ def on_local_output_selection_changed(app) -> None:
     if app.playback_state == PlaybackState.PLAYING and app.playback_track_info:
         app._resume_after_sendspin_connect = True
         if os.getenv("SENDSPIN_DEBUG"):
-            logging.getLogger(__name__).info(
+            _logger.info(
                 "Output changed while playing; will resume after Sendspin reconnect."
             )
     if os.getenv("SENDSPIN_DEBUG"):
         local_output = app.output_manager.get_preferred_local_output()
-        logging.getLogger(__name__).info(
+        _logger.info(
             "Selected local output: %s",
             local_output["name"] if local_output else "System Default",
         )
@@ -233,11 +246,11 @@ def on_group_player_toggled(app, player_id: str, checked: bool) -> None:
 
 
 def on_sendspin_connected(app) -> None:
-    GLib.idle_add(app.output_manager.refresh)
+    GLib.idle_add(app.output_manager.refresh, True)
     if getattr(app, "_resume_after_sendspin_connect", False):
         app._resume_after_sendspin_connect = False
         if os.getenv("SENDSPIN_DEBUG"):
-            logging.getLogger(__name__).info(
+            _logger.info(
                 "Resuming playback after Sendspin reconnect."
             )
         GLib.idle_add(app.send_playback_command, "resume")
@@ -251,11 +264,10 @@ def cancel_sendspin_pipeline_teardown(app) -> None:
     teardown_id = app.sendspin_pipeline_teardown_id
     if teardown_id is None:
         return
-    try:
-        GLib.source_remove(teardown_id)
-    except Exception:
-        pass
     app.sendspin_pipeline_teardown_id = None
+    source = GLib.MainContext.default().find_source_by_id(teardown_id)
+    if source is not None and not source.is_destroyed():
+        source.destroy()
 
 
 def schedule_sendspin_pipeline_teardown(
@@ -324,45 +336,49 @@ def on_sendspin_stream_clear(app) -> None:
 def on_sendspin_audio_chunk(
     app, timestamp_us: int, payload: bytes, format_info: sendspin.PCMFormat
 ) -> None:
-    app.cancel_sendspin_pipeline_teardown()
-    if getattr(app, "playback_pending", False):
+    if app.sendspin_pipeline_teardown_id is not None:
+        app.cancel_sendspin_pipeline_teardown()
+    if app.playback_pending:
         GLib.idle_add(app.mark_playback_started)
-    if not app.audio_pipeline.is_active():
-        local_output = app.output_manager.get_preferred_local_output()
+    pipeline = app.audio_pipeline
+    if not pipeline.active:
+        output_manager = app.output_manager
+        sendspin_manager = app.sendspin_manager
+        local_output = output_manager.get_preferred_local_output()
         bitperfect_ready = (
-            getattr(app, "output_bitperfect", False)
+            app.output_bitperfect
             and local_output is not None
             and local_output.get("is_bitperfect_capable")
         )
         if bitperfect_ready:
-            hw_path = app.output_manager.create_bitperfect_sink_for_output(local_output["id"])
+            hw_path = output_manager.create_bitperfect_sink_for_output(local_output["id"])
             if hw_path is not None:
-                app.audio_pipeline.create_bitperfect_pipeline(format_info, hw_path)
+                pipeline.create_bitperfect_pipeline(format_info, hw_path)
             else:
                 sink = None
                 if local_output:
-                    sink = app.output_manager.create_sink_for_output(local_output["id"])
+                    sink = output_manager.create_sink_for_output(local_output["id"])
                 if sink is None:
-                    sink = app.output_manager.create_default_sink()
-                app.audio_pipeline.create_pipeline(
+                    sink = output_manager.create_default_sink()
+                pipeline.create_pipeline(
                     format_info,
                     sink,
-                    app.sendspin_manager.volume,
-                    app.sendspin_manager.muted,
+                    sendspin_manager.volume,
+                    sendspin_manager.muted,
                 )
         else:
             sink = None
             if local_output:
-                sink = app.output_manager.create_sink_for_output(local_output["id"])
+                sink = output_manager.create_sink_for_output(local_output["id"])
             if sink is None:
-                sink = app.output_manager.create_default_sink()
-            app.audio_pipeline.create_pipeline(
+                sink = output_manager.create_default_sink()
+            pipeline.create_pipeline(
                 format_info,
                 sink,
-                app.sendspin_manager.volume,
-                app.sendspin_manager.muted,
+                sendspin_manager.volume,
+                sendspin_manager.muted,
             )
-    app.audio_pipeline.push_audio(timestamp_us, payload, format_info)
+    pipeline.push_audio(timestamp_us, payload, format_info)
 
 
 def on_sendspin_volume_change(app, volume: int) -> None:
@@ -460,7 +476,6 @@ def _transfer_output_worker(
     target_player_id: str,
     auto_play: bool | None,
 ) -> None:
-    error = ""
     try:
         playback.transfer_queue(
             app.client_session,
@@ -471,12 +486,8 @@ def _transfer_output_worker(
             auto_play,
         )
     except Exception as exc:
-        error = str(exc)
-    if error:
-        logging.getLogger(__name__).warning(
-            "Output transfer failed: %s",
-            error,
-        )
+        if _logger.isEnabledFor(logging.WARNING):
+            _logger.warning("Output transfer failed: %s", exc)
 
 
 def _schedule_group_members_refresh(
@@ -552,7 +563,7 @@ def _on_group_members_refreshed(
     ):
         app.group_members_refresh_player_id = None
     if error:
-        logging.getLogger(__name__).warning(
+        _logger.warning(
             "Unable to fetch grouped players: %s",
             error,
         )
@@ -660,7 +671,7 @@ def _group_player_toggle_worker(
     except Exception as exc:
         error = str(exc)
     if error:
-        logging.getLogger(__name__).warning(
+        _logger.warning(
             "Group players update failed: %s",
             error,
         )
@@ -675,7 +686,9 @@ def _group_player_toggle_worker(
 
 
 def set_output_volume(app, volume: int) -> None:
-    volume = max(0, min(100, volume))
+    volume = max(0, min(100, int(volume)))
+    if volume == app.last_volume_value:
+        return
     app.last_volume_value = volume
     if app.output_manager.is_sendspin_player_id(app.output_manager.preferred_player_id):
         app.set_sendspin_volume(volume)
@@ -691,12 +704,9 @@ def set_output_volume(app, volume: int) -> None:
         )
     ):
         return
-    thread = threading.Thread(
-        target=app._volume_command_worker,
-        args=(app.output_manager.preferred_player_id, volume),
-        daemon=True,
-    )
-    thread.start()
+    # set_player_volume only queues the request on the client session loop,
+    # so it is safe to call from the GTK thread.
+    app._volume_command_worker(app.output_manager.preferred_player_id, volume)
 
 
 def _volume_command_worker(
@@ -704,7 +714,6 @@ def _volume_command_worker(
     player_id: str,
     volume: int,
 ) -> None:
-    error = ""
     try:
         playback.set_player_volume(
             app.client_session,
@@ -714,6 +723,5 @@ def _volume_command_worker(
             volume,
         )
     except Exception as exc:
-        error = str(exc)
-    if error:
-        logging.getLogger(__name__).warning("Volume update failed: %s", error)
+        if _logger.isEnabledFor(logging.WARNING):
+            _logger.warning("Volume update failed: %s", exc)
@@ -1,7 +1,7 @@
-import asyncio, ctypes, ctypes.util, logging, os, re, threading
+import concurrent.futures, ctypes, ctypes.util, functools, logging, os, re, threading, time
 from contextlib import contextmanager
 
-from music_assistant_client import MusicAssistantClient
+from .client_session import ClientSession
 
 Gst = None
 try:
@@ -9,41 +9,269 @@ try:
 except (ImportError, ValueError):
     Gst = None
 
+_GST_INITED = False
 _ALSA_LIB = None
 _ALSA_ERROR_HANDLER = None
 _ALSA_HANDLER_LOCK = threading.Lock()
+_ALSA_INIT_LOCK = threading.Lock()
 _ALSA_HANDLER_REFCOUNT = 0
+_ALSA_LIBC = None
+_ALSA_CARDS_CACHE = (None, {})
+_ALSA_PCM_CACHE = (None, {})
+_ALSA_CARD_RE = re.compile(r"\s*(\d+)\s+\[(.*?)\]:\s*(.*)")
+_ALSA_PCM_RE = re.compile(r"\s*(\d+)-(\d+):\s*(.*?)\s*:\s*(.*?)\s*:\s*(.*)")
+_ALSA_HW_PATH_RE = re.compile(r"hw:(\d+),(\d+)")
+_ALSA_HINT_HW_RE = re.compile(r"hw:CARD=([^,]+),DEV=(\d+)$")
+_ALSA_DEVICE_PREFIX_RE = re.compile(r"(?:hw|plughw|iec958|front|dmix|dsnoop|alsa|plug):|surround|sysdefault")
+_DEVICE_PROBE_WORKERS = 4
+_PLAYERS_TTL = 2.0
+_DEBUG = bool(os.environ.get("SENDSPIN_DEBUG"))
+_PCM_FORMAT = {16: "S16LE", 24: "S24LE", 32: "S32LE"}
+_PCM_CANDIDATE_RATES = (44100, 48000, 88200, 96000, 176400, 192000, 352800, 384000)
+_PCM_DEPTH_FORMATS = ((16, ("S16LE",)), (24, ("S24LE", "S24_32LE")), (32, ("S32LE",)))
+_PCM_CANDIDATE_FORMATS = tuple(gst_format for _depth, formats in _PCM_DEPTH_FORMATS for gst_format in formats)
+_STRUCTURE_INT_TYPES = frozenset(("int", "uint", "gint", "guint", "int64", "uint64", "gint64", "guint64", "long", "ulong"))
+_STRUCTURE_FLOAT_TYPES = frozenset(("double", "float", "gdouble", "gfloat"))
+_STRUCTURE_BOOL_TYPES = frozenset(("boolean", "bool", "gboolean"))
+_PIPEWIRE_TARGET_KEYS = ("object.serial", "object.id", "node.name", "object.path")
+_STRUCTURE_BRACKETS = {"{": "}", "<": ">", "[": "]", "(": ")"}
+
+
+def _ensure_gst_init():
+    global _GST_INITED
+    if not _GST_INITED:
+        Gst.init(None); _GST_INITED = True
+
+
+def _set_element_property(element, name, value):
+    # Skip elements built without the property (e.g. older pipewiresink has
+    # no target-object) instead of raising and swallowing a TypeError.
+    if element.find_property(name) is None:
+        return False
+    try:
+        element.set_property(name, value)
+    except Exception:
+        return False
+    return True
 
 
 def _load_alsa_lib():
     global _ALSA_LIB
     if _ALSA_LIB is not None:
         return _ALSA_LIB or None
+    with _ALSA_INIT_LOCK:
+        if _ALSA_LIB is None:
+            _ALSA_LIB = _open_alsa_lib()
+    return _ALSA_LIB or None
+
+
+def _open_alsa_lib():
     path = ctypes.util.find_library("asound") or "libasound.so.2"
     try:
         lib = ctypes.CDLL(path)
     except OSError:
-        _ALSA_LIB = False
-        return None
+        return False
     lib.snd_lib_error_set_handler.argtypes = [ctypes.c_void_p]
     lib.snd_lib_error_set_handler.restype = None
-    _ALSA_LIB = lib
+    if hasattr(lib, "snd_device_name_hint"):
+        lib.snd_device_name_hint.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))]
+        lib.snd_device_name_hint.restype = ctypes.c_int
+        lib.snd_device_name_free_hint.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
+        lib.snd_device_name_free_hint.restype = ctypes.c_int
+        lib.snd_device_name_get_hint.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        lib.snd_device_name_get_hint.restype = ctypes.c_void_p
+        lib.snd_card_get_index.argtypes = [ctypes.c_char_p]
+        lib.snd_card_get_index.restype = ctypes.c_int
     return lib
 
 
+def _load_libc():
+    global _ALSA_LIBC
+    if _ALSA_LIBC is not None:
+        return _ALSA_LIBC or None
+    with _ALSA_INIT_LOCK:
+        if _ALSA_LIBC is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6")
+            except OSError:
+                libc = False
+            else:
+                libc.free.argtypes = [ctypes.c_void_p]
+                libc.free.restype = None
+            _ALSA_LIBC = libc
+    return _ALSA_LIBC or None
+
+
+def _get_alsa_hint(lib, libc, hint, key):
+    value = lib.snd_device_name_get_hint(hint, key)
+    if not value:
+        return None
+    try:
+        return ctypes.string_at(value).decode("utf-8", "replace")
+    finally:
+        libc.free(value)
+
+
+def _read_alsa_hints():
+    lib = _load_alsa_lib()
+    if not lib or not hasattr(lib, "snd_device_name_hint"):
+        return None
+    libc = _load_libc()
+    if not libc:
+        return None
+    hints = ctypes.POINTER(ctypes.c_void_p)()
+    with _suppress_alsa_errors():
+        if lib.snd_device_name_hint(-1, b"pcm", ctypes.byref(hints)) != 0 or not hints:
+            return None
+    cards, playback_devices = {}, {}
+    try:
+        index = 0
+        while hints[index]:
+            hint = hints[index]
+            index += 1
+            if _get_alsa_hint(lib, libc, hint, b"IOID") not in (None, "Output"):
+                continue
+            match = _ALSA_HINT_HW_RE.match(_get_alsa_hint(lib, libc, hint, b"NAME") or "")
+            if not match:
+                continue
+            card_index = lib.snd_card_get_index(match.group(1).encode("utf-8"))
+            if card_index < 0:
+                continue
+            device_index = int(match.group(2))
+            current = playback_devices.get(card_index)
+            if current is None or device_index < current:
+                playback_devices[card_index] = device_index
+            if card_index not in cards:
+                description = _get_alsa_hint(lib, libc, hint, b"DESC") or ""
+                first_line = description.splitlines()[0] if description else ""
+                cards[card_index] = first_line.split(", ", 1)[0].strip() or match.group(1)
+    finally:
+        lib.snd_device_name_free_hint(hints)
+    return cards, playback_devices
+
+
 def _get_alsa_error_handler():
+    # ALSA keeps the raw trampoline pointer after snd_lib_error_set_handler,
+    # so the CFUNCTYPE object must stay referenced by this module global for
+    # the life of the process; it is created once under _ALSA_INIT_LOCK.
     global _ALSA_ERROR_HANDLER
     if _ALSA_ERROR_HANDLER is not None:
         return _ALSA_ERROR_HANDLER
-    handler_type = ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p)
+    with _ALSA_INIT_LOCK:
+        if _ALSA_ERROR_HANDLER is None:
+            handler_type = ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p)
 
-    def _handler(_file, _line, _function, _err, _fmt):
-        return None
+            def _handler(_file, _line, _function, _err, _fmt):
+                return None
 
-    _ALSA_ERROR_HANDLER = handler_type(_handler)
+            _ALSA_ERROR_HANDLER = handler_type(_handler)
     return _ALSA_ERROR_HANDLER
 
 
+def _read_structure_value(text, index):
+    length = len(text)
+    if index < length and text[index] == '"':
+        index += 1; data = bytearray()
+        while index < length and text[index] != '"':
+            char = text[index]
+            if char == "\\" and index + 1 < length:
+                octal = text[index + 1:index + 4]
+                if len(octal) == 3 and all(digit in "01234567" for digit in octal):
+                    data.append(int(octal, 8) & 0xFF); index += 4; continue
+                char = text[index + 1]; index += 1
+            data.extend(char.encode("utf-8")); index += 1
+        return data.decode("utf-8", "replace"), index + 1
+    if index < length and text[index] in _STRUCTURE_BRACKETS:
+        depth, quoted = 0, False
+        while index < length:
+            char = text[index]
+            if quoted:
+                if char == "\\": index += 1
+                elif char == '"': quoted = False
+            elif char == '"': quoted = True
+            elif char in _STRUCTURE_BRACKETS: depth += 1
+            elif char in "}>])":
+                depth -= 1
+                if depth == 0: return None, index + 1
+            index += 1
+        return None, index
+    start = index
+    while index < length and text[index] not in ",;": index += 1
+    return text[start:index].strip(), index
+
+
+def _convert_structure_value(value_type, raw):
+    if raw is None: return None
+    if value_type in ("string", "gchararray"): return raw
+    try:
+        if value_type in _STRUCTURE_INT_TYPES: return int(raw)
+        if value_type in _STRUCTURE_FLOAT_TYPES: return float(raw)
+    except ValueError:
+        return None
+    if value_type in _STRUCTURE_BOOL_TYPES: return raw.casefold() in ("true", "yes", "t", "1")
+    return None
+
+
+def _parse_gst_structure(text):
+    # Serialized form: name, key=(type)value, key=(type)"quoted value";
+    # The structure name is kept under "", which is never a valid field name.
+    length = len(text); index = 0
+    while index < length and text[index] not in ",;": index += 1
+    fields = {"": text[:index].strip()}
+    while index < length and text[index] == ",":
+        separator = text.find("=", index + 1)
+        if separator < 0: break
+        key = text[index + 1:separator].strip(); index = separator + 1; value_type = None
+        if index < length and text[index] == "(":
+            close = text.find(")", index)
+            if close < 0: break
+            value_type = text[index + 1:close]; index = close + 1
+        raw, index = _read_structure_value(text, index)
+        fields[key] = _convert_structure_value(value_type, raw)
+        while index < length and text[index] not in ",;": index += 1
+    return fields
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_alsa_device_path(value):
+    cleaned = value.strip()
+    if not cleaned:
+        return ""
+    if "{" in cleaned:
+        cleaned = cleaned.split("{", 1)[0].rstrip()
+    if cleaned.endswith(":"):
+        cleaned = cleaned[:-1].rstrip()
+    return cleaned
+
+
+@functools.lru_cache(maxsize=128)
+def _looks_like_alsa_device(value):
+    cleaned = value.strip()
+    if not cleaned:
+        return False
+    if "{" in cleaned:
+        return True
+    return _ALSA_DEVICE_PREFIX_RE.match(cleaned.casefold()) is not None
+
+
+@functools.lru_cache(maxsize=128)
+def _extract_alsa_target(value):
+    cleaned = value.strip()
+    if cleaned.startswith("alsa:"):
+        cleaned = cleaned.split(":", 1)[1]
+    return _normalize_alsa_device_path(cleaned)
+
+
+@functools.lru_cache(maxsize=1)
+def _pw_target():
+    return os.getenv("SENDSPIN_PIPEWIRE_TARGET", "").strip()
+
+
+@functools.lru_cache(maxsize=1)
+def _prefer_pw():
+    return bool(os.getenv("SENDSPIN_PREFER_PIPEWIRE"))
+
+
 @contextmanager
 def _suppress_alsa_errors():
     if os.getenv("MA_SHOW_ALSA_ERRORS"):
@@ -77,39 +305,80 @@ class OutputManager:
         self._get_pulse_device = get_pulse_device or (lambda: "")
         self._get_alsa_device = get_alsa_device or (lambda: "")
         self.local_device_names = local_device_names or set(); self.on_outputs_changed = on_outputs_changed; self.on_output_selected = on_output_selected; self.on_loading_state_changed = on_loading_state_changed
-        self.local_audio_outputs = []; self.local_audio_outputs_by_id = {}; self.local_audio_lock = threading.Lock(); self.output_targets = []; self.output_target_rows = {}; self.sendspin_player_id = None
+        self.local_audio_outputs = (); self.local_audio_outputs_by_id = {}; self.local_audio_lock = threading.Lock(); self.output_targets = (); self._row_index = {}; self._first_key = None; self._sendspin_keys = (); self.sendspin_player_id = None
         self.preferred_player_id = None; self.preferred_local_output_id = None; self.preferred_local_output_name = None; self.output_loading = False; self.status_message = ""
         self._selected_key = None; self._refresh_pending = False; self._refresh_after_load = False
+        self._players_cache = None; self._players_cache_key = None; self._players_cache_time = 0.0
+        self._refresh_event = threading.Event(); self._refresh_stop = False; self._refresh_thread = None
+        self._settings_cache = (None, None); self._local_name_pattern = None
+        self._owned_client_session = None; self._device_monitor = None; self._device_monitor_failed = False; self._device_monitor_lock = threading.Lock(); self._audio_sinks_cache = []; self._audio_sinks_dirty = True
         self._logger = logging.getLogger(__name__)
 
-    def get_local_outputs(self): return list(self.local_audio_outputs)
-    def get_output_targets(self): return list(self.output_targets)
-    def get_selected_output(self): return self.output_target_rows.get(self._selected_key) if self._selected_key else None
+    # Both are published as tuples once built, so callers can share them
+    # without a defensive copy.
+    def get_local_outputs(self): return self.local_audio_outputs
+    def get_output_targets(self): return self.output_targets
+    def get_selected_output(self): return self._row_for_key(self._selected_key) if self._selected_key else None
+
+    def _row_for_key(self, key):
+        # Rows are dicts because the GTK layer consumes them as mappings; the
+        # index map only stores positions into output_targets. The key check
+        # guards against reading a list that a concurrent refresh replaced.
+        index = self._row_index.get(key); targets = self.output_targets
+        if index is None or index >= len(targets): return None
+        output = targets[index]
+        return output if (output["player_id"], output["local_output_id"]) == key else None
 
     def schedule_refresh(self):
-        if self._refresh_pending: return
-        self._refresh_pending = True; timer = threading.Timer(0.3, self._handle_scheduled_refresh); timer.daemon = True; timer.start()
+        if self._refresh_pending or self._refresh_stop: return
+        self._refresh_pending = True
+        if self._refresh_thread is None: self._refresh_thread = threading.Thread(target=self._refresh_loop, name="output-refresh", daemon=True); self._refresh_thread.start()
+        self._refresh_event.set()
+
+    def _refresh_loop(self):
+        while True:
+            self._refresh_event.wait()
+            if self._refresh_stop: return
+            self._refresh_event.clear(); time.sleep(0.3)
+            if self._refresh_stop: return
+            self._handle_scheduled_refresh()
+
+    def close(self):
+        self._refresh_stop = True; self._refresh_event.set()
+        if self._owned_client_session is not None: self._owned_client_session.stop(); self._owned_client_session = None
+        with self._device_monitor_lock:
+            monitor = self._device_monitor; self._device_monitor = None; self._audio_sinks_cache = []
+        if monitor is not None:
+            try: monitor.get_bus().remove_watch()
+            except Exception: pass
+            monitor.stop()
 
     def _handle_scheduled_refresh(self): self._refresh_pending = False; self.refresh()
 
-    def refresh(self):
+    def refresh(self, force=False):
         if self.output_loading: self._refresh_after_load = True; return
-        if not self._get_server_url(): self._set_loading_state(False, "Connect to your Music Assistant server to see outputs."); self.populate_output_targets([]); return
+        server_url = self._get_server_url()
+        if not server_url: self._set_loading_state(False, "Connect to your Music Assistant server to see outputs."); self.populate_output_targets([]); return
+        if force: self.invalidate_players_cache()
+        elif self._players_cache is not None and self._players_cache_key == (server_url, self._get_auth_token()) and time.monotonic() - self._players_cache_time < _PLAYERS_TTL:
+            # Only the player fetch is cached; populating still scans local devices, so keep it off the caller's thread.
+            self._set_loading_state(True, "Loading outputs..."); threading.Thread(target=self.on_output_targets_loaded, args=(self._players_cache, ""), daemon=True).start(); return
         self._set_loading_state(True, "Loading outputs..."); threading.Thread(target=self._load_output_targets_worker, daemon=True).start()
 
+    def invalidate_players_cache(self): self._players_cache = None; self._players_cache_key = None; self._players_cache_time = 0.0
+
     def _load_output_targets_worker(self):
+        server_url, auth_token = self._get_server_url(), self._get_auth_token()
         try:
-            if self._client_session:
-                players = self._client_session.run(
-                    self._get_server_url(),
-                    self._get_auth_token(),
-                    self._fetch_output_targets_async,
-                )
-            else:
-                players = asyncio.run(self._fetch_output_targets_legacy())
+            players = self._get_client_session().run(
+                server_url,
+                auth_token,
+                self._fetch_output_targets_async,
+            )
             error = ""
         except Exception as exc:
             players, error = [], str(exc)
+        if not error: self._players_cache = players; self._players_cache_key = (server_url, auth_token); self._players_cache_time = time.monotonic()
         self.on_output_targets_loaded(players, error)
 
     async def _fetch_output_targets_async(self, client):
@@ -122,10 +391,12 @@ class OutputManager:
         players.sort(key=lambda player: player.name.casefold())
         return players
 
-    async def _fetch_output_targets_legacy(self):
-        token = self._get_auth_token() or None
-        async with MusicAssistantClient(self._get_server_url(), None, token=token) as client:
-            return await self._fetch_output_targets_async(client)
+    def _get_client_session(self):
+        # Without a shared session, keep a private one so every refresh reuses
+        # the same background loop and connected client.
+        if self._client_session: return self._client_session
+        if self._owned_client_session is None: self._owned_client_session = ClientSession()
+        return self._owned_client_session
 
     def on_output_targets_loaded(self, players, error):
         if error: self.populate_output_targets([]); self._set_loading_state(False, f"Unable to load outputs: {error}"); return
@@ -133,22 +404,28 @@ class OutputManager:
             for player in players: self._logger.info("Output option: %s (id=%s)", getattr(player, "name", "Unknown"), getattr(player, "player_id", "unknown"))
         else: self._logger.info("Output option list is empty.")
         self.populate_output_targets(players); self._set_loading_state(False, "" if players else "No outputs available.")
-        if self._refresh_after_load: self._refresh_after_load = False; self.refresh()
+        if self._refresh_after_load: self._refresh_after_load = False; self.refresh(force=True)
 
     def populate_output_targets(self, players):
-        self.output_targets = []; self.output_target_rows = {}; self.sendspin_player_id = None
-        local_outputs = self.refresh_local_audio_outputs() if self._has_sendspin_support() else []
+        self.output_targets = []; self._row_index = {}; self._first_key = None; self._sendspin_keys = (); self.sendspin_player_id = None
+        sendspin_ctx = self._sendspin_ctx()
         for player in players:
             display_name = player.name
-            if self.is_sendspin_player(player): self.sendspin_player_id = player.player_id; self.add_sendspin_output_rows(player, local_outputs); continue
-            if self.is_local_player(player): display_name = f"{display_name} (This Computer)"
+            if self._is_sendspin_player_ctx(player, sendspin_ctx):
+                # Local devices only feed the Sendspin rows, so they are scanned
+                # when that player is present and turned into rows straight away.
+                local_outputs = self.refresh_local_audio_outputs() if self._has_sendspin_support() else []
+                self.sendspin_player_id = player.player_id; self.add_sendspin_output_rows(player, local_outputs); continue
+            if self._is_local_player_name(player): display_name = f"{display_name} (This Computer)"
             self.add_output_row(player.player_id, display_name)
+        self.output_targets = tuple(self.output_targets); self._first_key = next(iter(self._row_index), None)
         selected_key = self.pick_default_output_key()
         selection_changed = self._set_selection(selected_key[0], selected_key[1]) if selected_key else (self._set_selection(None, None) if not players else False)
         self._notify_outputs_changed();
         if selection_changed: self._notify_output_selected()
 
     def add_sendspin_output_rows(self, player, local_outputs):
+        self._sendspin_keys = ((player.player_id, self.preferred_local_output_id), (player.player_id, None))
         self.add_output_row(player.player_id, "This Computer (Music Assistant GTK)", local_output_id=None, local_output_name="System Default")
         backend, _pulse_device, _alsa_device = self.get_effective_output_settings()
         for output in local_outputs:
@@ -171,7 +448,7 @@ class OutputManager:
 
     def add_output_row(self, player_id, display_name, local_output_id=None, local_output_name=None, is_bitperfect_capable=False, bitperfect_formats=None):
         key = (player_id, local_output_id)
-        if key in self.output_target_rows:
+        if key in self._row_index:
             return
         output = {
             "player_id": player_id,
@@ -181,29 +458,31 @@ class OutputManager:
             "is_bitperfect_capable": bool(is_bitperfect_capable),
             "bitperfect_formats": bitperfect_formats,
         }
-        self.output_targets.append(output); self.output_target_rows[key] = output
+        self._row_index[key] = len(self.output_targets); self.output_targets.append(output)
 
     def pick_default_output_key(self):
-        if not self.output_target_rows: return None
+        if not self._row_index: return None
         if self.preferred_player_id:
             preferred_key = (self.preferred_player_id, self.preferred_local_output_id)
-            if preferred_key in self.output_target_rows: return preferred_key
+            if preferred_key in self._row_index: return preferred_key
             fallback_key = (self.preferred_player_id, None)
-            if fallback_key in self.output_target_rows: return fallback_key
-        if self.sendspin_player_id:
-            preferred_key = (self.sendspin_player_id, self.preferred_local_output_id)
-            if preferred_key in self.output_target_rows: return preferred_key
-            fallback_key = (self.sendspin_player_id, None)
-            if fallback_key in self.output_target_rows: return fallback_key
-        return next(iter(self.output_target_rows.keys()))
-
-    def is_sendspin_player(self, player):
+            if fallback_key in self._row_index: return fallback_key
+        for sendspin_key in self._sendspin_keys:
+            if sendspin_key in self._row_index: return sendspin_key
+        return self._first_key
+
+    def is_sendspin_player(self, player): return self._is_sendspin_player_ctx(player, self._sendspin_ctx())
+
+    def _sendspin_ctx(self): return self._get_sendspin_client_id(), (self._get_sendspin_client_name() or "").casefold()
+
+    @staticmethod
+    def _is_sendspin_player_ctx(player, ctx):
         player_id = getattr(player, "player_id", None)
         if not player_id: return False
-        sendspin_id = self._get_sendspin_client_id()
+        sendspin_id, sendspin_name = ctx
         if sendspin_id: return player_id == sendspin_id
-        player_name = getattr(player, "name", ""); sendspin_name = self._get_sendspin_client_name()
-        return bool(sendspin_name and player_name and player_name.strip().casefold() == sendspin_name.casefold())
+        player_name = getattr(player, "name", "")
+        return bool(sendspin_name and player_name and player_name.strip().casefold() == sendspin_name)
 
     def is_sendspin_player_id(self, player_id):
         if not player_id: return False
@@ -212,18 +491,28 @@ class OutputManager:
 
     def is_local_player(self, player):
         if self.is_sendspin_player(player): return True
+        return self._is_local_player_name(player)
+
+    def _is_local_player_name(self, player):
         if not self.local_device_names: return False
         name = getattr(player, "name", "") or ""; normalized = name.casefold()
         if normalized in self.local_device_names: return True
-        return any(local in normalized for local in self.local_device_names)
+        return self._get_local_name_pattern().search(normalized) is not None
+
+    def _get_local_name_pattern(self):
+        names = self.local_device_names; cached = self._local_name_pattern
+        if cached is not None and cached[0] is names and cached[1] == len(names): return cached[2]
+        pattern = re.compile("|".join(re.escape(local) for local in sorted(names, key=len, reverse=True) if local) or "(?!)")
+        self._local_name_pattern = (names, len(names), pattern); return pattern
 
     def select_output(self, player_id, local_output_id=None):
+        self.invalidate_players_cache()
         if self._set_selection(player_id, local_output_id): self._notify_output_selected()
 
     def _set_selection(self, player_id, local_output_id):
         previous_key = self._selected_key; self.preferred_player_id = player_id
         if self.is_sendspin_player_id(player_id):
-            self.preferred_local_output_id = local_output_id; output = self.output_target_rows.get((player_id, local_output_id))
+            self.preferred_local_output_id = local_output_id; output = self._row_for_key((player_id, local_output_id))
             self.preferred_local_output_name = output.get("local_output_name") if output else None
         self._selected_key = (player_id, local_output_id) if player_id else None
         return previous_key != self._selected_key
@@ -249,18 +538,51 @@ class OutputManager:
         return result
 
     def _is_pipewire_device_obj(self, item):
-        try: return self.is_pipewire_device(item.get_properties(), item.get_device_class() or "")
+        try: return self.is_pipewire_device(self._props_to_dict(item.get_properties()), item.get_device_class() or "")
         except Exception: return False
 
-    def _list_audio_sink_devices(self):
-        if Gst is None: return []
-        Gst.init(None); monitor = Gst.DeviceMonitor(); monitor.add_filter("Audio/Sink", None)
+    def _ensure_device_monitor(self):
+        # The monitor stays started for the app lifetime; providers keep its
+        # device list current and the bus watch flags when it has changed.
+        if self._device_monitor is not None: return self._device_monitor
+        # A monitor that failed to start once keeps failing; use the one-shot probe from then on.
+        if self._device_monitor_failed: return None
+        _ensure_gst_init(); monitor = Gst.DeviceMonitor(); monitor.add_filter("Audio/Sink", None)
+        with _suppress_alsa_errors():
+            started = monitor.start()
+        if not started: self._device_monitor_failed = True; return None
+        try: monitor.get_bus().add_watch(0, self._on_device_monitor_message)
+        except Exception: self._logger.debug("Unable to watch the audio device monitor bus; device list may be stale.")
+        self._device_monitor = monitor; self._audio_sinks_dirty = True
+        return monitor
+
+    def _on_device_monitor_message(self, _bus, message):
+        if message.type in (Gst.MessageType.DEVICE_ADDED, Gst.MessageType.DEVICE_REMOVED): self._audio_sinks_dirty = True
+        return True
+
+    def _probe_audio_sink_devices(self):
+        _ensure_gst_init(); monitor = Gst.DeviceMonitor(); monitor.add_filter("Audio/Sink", None)
         try:
             with _suppress_alsa_errors():
-                monitor.start(); devices = list(monitor.get_devices() or [])
+                monitor.start(); return list(monitor.get_devices() or [])
         finally: monitor.stop()
+
+    def _list_audio_sink_devices(self):
+        if Gst is None: return []
+        with self._device_monitor_lock:
+            monitor = self._ensure_device_monitor()
+            if monitor is None: return self._filter_pipewire_devices(self._probe_audio_sink_devices())
+            if self._audio_sinks_dirty:
+                self._audio_sinks_dirty = False
+                with _suppress_alsa_errors():
+                    devices = list(monitor.get_devices() or [])
+                self._audio_sinks_cache = self._filter_pipewire_devices(devices)
+            return list(self._audio_sinks_cache)
+
+    def _filter_pipewire_devices(self, devices):
         if not devices: return []
-        if any(self._is_pipewire_device_obj(device) for device in devices): devices = [device for device in devices if self._is_pipewire_device_obj(device)]
+        flags = [self._is_pipewire_device_obj(device) for device in devices]
+        if any(flags): return [device for device, is_pipewire in zip(devices, flags) if is_pipewire]
         return devices
 
     def refresh_local_audio_outputs(self):
@@ -270,22 +592,27 @@ class OutputManager:
             if outputs:
                 with self.local_audio_lock:
                     output_map = {output["id"]: output for output in outputs}
-                    self.local_audio_outputs = outputs; self.local_audio_outputs_by_id = output_map; return outputs
-        if Gst is None: self.local_audio_outputs = []; self.local_audio_outputs_by_id = {}; return []
+                    self.local_audio_outputs = tuple(outputs); self.local_audio_outputs_by_id = output_map; return outputs
+        if Gst is None: self.local_audio_outputs = (); self.local_audio_outputs_by_id = {}; return []
         with self.local_audio_lock:
             outputs, output_map = [], {}
-            for device in self._list_audio_sink_devices():
-                output = self.describe_local_audio_output(device)
+            devices = self._list_audio_sink_devices()
+            if len(devices) > 1:
+                with _suppress_alsa_errors(), concurrent.futures.ThreadPoolExecutor(max_workers=min(_DEVICE_PROBE_WORKERS, len(devices)), thread_name_prefix="audio-output-probe") as executor:
+                    described = list(executor.map(self.describe_local_audio_output, devices))
+            else:
+                described = [self.describe_local_audio_output(device) for device in devices]
+            for output in described:
                 if not output or output["id"] in output_map: continue
                 outputs.append(output); output_map[output["id"]] = output
             outputs.sort(key=lambda item: (not item["is_usb"], item["name"].casefold()))
-            self.local_audio_outputs = outputs; self.local_audio_outputs_by_id = output_map; return outputs
+            self.local_audio_outputs = tuple(outputs); self.local_audio_outputs_by_id = output_map; return outputs
 
     def describe_local_audio_output(self, device):
         if Gst is None: return None
         try:
             display_name = device.get_display_name() or ""
-            props = device.get_properties()
+            props = self._props_to_dict(device.get_properties())
             device_class = device.get_device_class() or ""
         except Exception:
             return None
@@ -306,7 +633,7 @@ class OutputManager:
         }
 
     def query_usb_dac_native_formats(self, hw_path):
-        match = re.match(r"hw:(\d+),(\d+)", hw_path or "")
+        match = _ALSA_HW_PATH_RE.match(hw_path or "")
         if not match:
             return []
         card_index = int(match.group(1))
@@ -446,8 +773,11 @@ class OutputManager:
             return []
 
     def list_alsa_outputs(self):
-        cards = self.read_alsa_cards()
-        playback_devices = self.read_alsa_playback_devices()
+        hints = None
+        try: hints = _read_alsa_hints()
+        except Exception as exc: self._logger.debug("ALSA device hint enumeration failed: %s", exc)
+        if hints: cards, playback_devices = hints
+        else: cards = self.read_alsa_cards(); playback_devices = self.read_alsa_playback_devices()
         outputs = []
         for card_index in sorted(playback_devices.keys()):
             device_index = playback_devices[card_index]
@@ -475,14 +805,20 @@ class OutputManager:
 
     @staticmethod
     def read_alsa_cards():
+        # procfs does not update st_mtime when cards change, so the parsed
+        # result is keyed on the raw file contents instead.
+        global _ALSA_CARDS_CACHE
         cards = {}
         try:
             with open("/proc/asound/cards", "r", encoding="utf-8") as handle:
-                lines = handle.readlines()
+                content = handle.read()
         except OSError:
             return cards
-        for line in lines:
-            match = re.match(r"\s*(\d+)\s+\[(.*?)\]:\s*(.*)", line)
+        cached_content, cached_cards = _ALSA_CARDS_CACHE
+        if content == cached_content:
+            return cached_cards
+        for line in content.splitlines():
+            match = _ALSA_CARD_RE.match(line)
             if not match:
                 continue
             try:
@@ -497,18 +833,23 @@ class OutputManager:
             if not label:
                 label = short_name or f"Card {card_index}"
             cards[card_index] = label
+        _ALSA_CARDS_CACHE = (content, cards)
         return cards
 
     @staticmethod
     def read_alsa_playback_devices():
+        global _ALSA_PCM_CACHE
         playback_devices = {}
         try:
             with open("/proc/asound/pcm", "r", encoding="utf-8") as handle:
-                lines = handle.readlines()
+                content = handle.read()
         except OSError:
             return playback_devices
-        for line in lines:
-            match = re.match(r"\s*(\d+)-(\d+):\s*(.*?)\s*:\s*(.*?)\s*:\s*(.*)", line)
+        cached_content, cached_devices = _ALSA_PCM_CACHE
+        if content == cached_content:
+            return cached_devices
+        for line in content.splitlines():
+            match = _ALSA_PCM_RE.match(line)
             if not match:
                 continue
             try:
@@ -522,15 +863,29 @@ class OutputManager:
             current = playback_devices.get(card_index)
             if current is None or device_index < current:
                 playback_devices[card_index] = device_index
+        _ALSA_PCM_CACHE = (content, playback_devices)
         return playback_devices
 
     def get_effective_output_settings(self):
-        backend = (self._get_output_backend() or "").strip().casefold()
-        pulse_device = (self._get_pulse_device() or "").strip()
-        alsa_device = self.normalize_alsa_device_path((self._get_alsa_device() or "").strip())
-        env_backend = os.getenv("SENDSPIN_OUTPUT_BACKEND", "").strip().casefold()
-        env_pulse_device = os.getenv("SENDSPIN_PULSE_DEVICE", "").strip()
-        env_alsa_device = self.normalize_alsa_device_path(os.getenv("SENDSPIN_ALSA_DEVICE", "").strip())
+        environ = os.environ
+        key = (
+            self._get_output_backend(),
+            self._get_pulse_device(),
+            self._get_alsa_device(),
+            environ.get("SENDSPIN_OUTPUT_BACKEND", ""),
+            environ.get("SENDSPIN_PULSE_DEVICE", ""),
+            environ.get("SENDSPIN_ALSA_DEVICE", ""),
+        )
+        cached_key, cached_settings = self._settings_cache
+        if key == cached_key:
+            return cached_settings
+        raw_backend, raw_pulse_device, raw_alsa_device, raw_env_backend, raw_env_pulse_device, raw_env_alsa_device = key
+        backend = (raw_backend or "").strip().casefold()
+        pulse_device = (raw_pulse_device or "").strip()
+        alsa_device = self.normalize_alsa_device_path((raw_alsa_device or "").strip())
+        env_backend = raw_env_backend.strip().casefold()
+        env_pulse_device = raw_env_pulse_device.strip()
+        env_alsa_device = self.normalize_alsa_device_path(raw_env_alsa_device.strip())
         if env_backend:
             backend = env_backend
         if env_pulse_device:
@@ -544,16 +899,21 @@ class OutputManager:
                 backend = "pulse"
             elif alsa_device:
                 backend = "alsa"
-        return backend, pulse_device, alsa_device
+        settings = (backend, pulse_device, alsa_device)
+        self._settings_cache = (key, settings)
+        return settings
+
+    @staticmethod
+    def _props_to_dict(props):
+        if props is None: return {}
+        try: return _parse_gst_structure(props.to_string())
+        except Exception: return {}
 
     @staticmethod
     def extract_gst_device_id(props, fallback):
         if props:
             for key in ("device.id", "node.name", "object.path", "device.name", "device.serial", "device.nick"):
-                try:
-                    if props.has_field(key): value = props.get_value(key)
-                    else: continue
-                except Exception: continue
+                value = props.get(key)
                 if isinstance(value, str):
                     cleaned = value.strip()
                     if cleaned: return cleaned
@@ -563,14 +923,9 @@ class OutputManager:
     def is_pipewire_device(props, device_class):
         if "pipewire" in (device_class or "").casefold(): return True
         if props:
-            try:
-                if props.has_field("node.name") or props.has_field("object.serial"):
-                    return True
-            except Exception:
-                pass
-            try: props_str = props.to_string()
-            except Exception: props_str = ""
-            if "pipewire" in props_str.casefold(): return True
+            if "node.name" in props or "object.serial" in props: return True
+            for key, value in props.items():
+                if "pipewire" in key.casefold() or (isinstance(value, str) and "pipewire" in value.casefold()): return True
         return False
 
     @staticmethod
@@ -578,10 +933,7 @@ class OutputManager:
         if "usb" in (display_name or "").casefold(): return True
         if props:
             for key in ("device.bus", "device.bus-path", "device.bus_path", "device.description", "device.name", "node.description", "node.name"):
-                try:
-                    if props.has_field(key): value = props.get_value(key)
-                    else: continue
-                except Exception: continue
+                value = props.get(key)
                 if isinstance(value, str) and "usb" in value.casefold(): return True
         return False
 
@@ -590,33 +942,65 @@ class OutputManager:
         try:
             if caps.is_empty(): return []
         except Exception: pass
-        candidate_rates = (44100, 48000, 88200, 96000, 176400, 192000, 352800, 384000); candidate_depths = (16, 24, 32); supported = set()
-        for bit_depth in candidate_depths:
-            gst_formats = [self.get_gst_pcm_format(bit_depth)]
-            if bit_depth == 24:
-                gst_formats.append("S24_32LE")
-            for sample_rate in candidate_rates:
+        supported = self._scan_pcm_caps_structures(caps)
+        if supported is None: supported = self._intersect_pcm_candidate_caps(caps)
+        return sorted(supported, key=lambda item: (item[0], item[1]))
+
+    @staticmethod
+    def _caps_field_matches(structure, field, candidates):
+        if not structure.has_field(field): return candidates
+        value = structure.get_value(field)
+        if isinstance(value, (int, str)) and not isinstance(value, bool): return tuple(candidate for candidate in candidates if candidate == value)
+        value_range = getattr(value, "range", None)
+        # gst-python exposes Gst.IntRange as range(min, max, step), but the caps range includes max.
+        if isinstance(value_range, range): return tuple(candidate for candidate in candidates if isinstance(candidate, int) and value_range.start <= candidate <= value_range.stop and (candidate - value_range.start) % value_range.step == 0)
+        values = getattr(value, "array", None)
+        if isinstance(values, (list, tuple)): return tuple(candidate for candidate in candidates if candidate in values)
+        raise TypeError(f"Unsupported caps value for {field}: {type(value).__name__}")
+
+    def _scan_pcm_caps_structures(self, caps):
+        try:
+            if caps.is_any(): return None
+            supported = set()
+            for index in range(caps.get_size()):
+                structure = caps.get_structure(index)
+                if structure.get_name() != "audio/x-raw": continue
+                if not self._caps_field_matches(structure, "channels", (2,)): continue
+                if not self._caps_field_matches(structure, "layout", ("interleaved",)): continue
+                rates = self._caps_field_matches(structure, "rate", _PCM_CANDIDATE_RATES)
+                if not rates: continue
+                formats = self._caps_field_matches(structure, "format", _PCM_CANDIDATE_FORMATS)
+                for bit_depth, gst_formats in _PCM_DEPTH_FORMATS:
+                    if any(gst_format in formats for gst_format in gst_formats):
+                        supported.update((sample_rate, bit_depth) for sample_rate in rates)
+            return supported
+        except Exception:
+            return None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _candidate_pcm_caps(gst_format, sample_rate):
+        return Gst.Caps.from_string(f"audio/x-raw,format={gst_format},channels=2,rate={sample_rate},layout=interleaved")
+
+    def _intersect_pcm_candidate_caps(self, caps):
+        supported = set()
+        for bit_depth, gst_formats in _PCM_DEPTH_FORMATS:
+            for sample_rate in _PCM_CANDIDATE_RATES:
                 for gst_format in gst_formats:
-                    candidate = Gst.Caps.from_string("audio/x-raw," f"format={gst_format}," "channels=2," f"rate={sample_rate}," "layout=interleaved")
+                    candidate = self._candidate_pcm_caps(gst_format, sample_rate)
                     try:
                         if caps.can_intersect(candidate):
                             supported.add((sample_rate, bit_depth))
                             break
                     except Exception:
                         continue
-        return sorted(supported, key=lambda item: (item[0], item[1]))
+        return supported
 
     @staticmethod
     def get_pipewire_node_name(props):
         if not props:
             return ""
-        try:
-            if props.has_field("node.name"):
-                value = props.get_value("node.name")
-            else:
-                value = None
-        except Exception:
-            value = None
+        value = props.get("node.name")
         if isinstance(value, str):
             return value.strip()
         return ""
@@ -625,30 +1009,13 @@ class OutputManager:
     def get_alsa_device_path(props):
         if not props:
             return ""
-        raw_path = None
-        try:
-            if props.has_field("api.alsa.path"):
-                raw_path = props.get_value("api.alsa.path")
-            else:
-                raw_path = None
-        except Exception:
-            raw_path = None
+        raw_path = props.get("api.alsa.path")
         if isinstance(raw_path, str):
             cleaned = OutputManager.normalize_alsa_device_path(raw_path)
             if cleaned:
                 return cleaned
-        card = None
-        device = None
-        try:
-            if props.has_field("api.alsa.pcm.card"):
-                card = props.get_value("api.alsa.pcm.card")
-        except Exception:
-            card = None
-        try:
-            if props.has_field("api.alsa.pcm.device"):
-                device = props.get_value("api.alsa.pcm.device")
-        except Exception:
-            device = None
+        card = props.get("api.alsa.pcm.card")
+        device = props.get("api.alsa.pcm.device")
         if isinstance(card, (int, float)) and isinstance(device, (int, float)):
             return f"hw:{int(card)},{int(device)}"
         return ""
@@ -657,48 +1024,25 @@ class OutputManager:
     def normalize_alsa_device_path(value: str) -> str:
         if not isinstance(value, str):
             return ""
-        cleaned = value.strip()
-        if not cleaned:
-            return ""
-        if "{" in cleaned:
-            cleaned = cleaned.split("{", 1)[0].rstrip()
-        if cleaned.endswith(":"):
-            cleaned = cleaned[:-1].rstrip()
-        return cleaned
+        return _normalize_alsa_device_path(value)
 
     @staticmethod
     def _looks_like_alsa_device(value: str) -> bool:
         if not isinstance(value, str):
             return False
-        cleaned = value.strip()
-        if not cleaned:
-            return False
-        lowered = cleaned.casefold()
-        if "{" in cleaned:
-            return True
-        if lowered.startswith(("hw:", "plughw:", "iec958:", "front:", "surround", "sysdefault", "dmix:", "dsnoop:", "alsa:", "plug:")):
-            return True
-        return False
+        return _looks_like_alsa_device(value)
 
     @staticmethod
     def _extract_alsa_target(value: str) -> str:
         if not isinstance(value, str):
             return ""
-        cleaned = value.strip()
-        if cleaned.startswith("alsa:"):
-            cleaned = cleaned.split(":", 1)[1]
-        return OutputManager.normalize_alsa_device_path(cleaned)
+        return _extract_alsa_target(value)
 
     def get_pulse_device_name(self, props, output_id: str | None = None) -> str:
         candidates = []
         if props:
             for key in ("node.name", "device.name", "device.nick", "object.path", "device.id"):
-                try:
-                    if not props.has_field(key):
-                        continue
-                    value = props.get_value(key)
-                except Exception:
-                    continue
+                value = props.get(key)
                 if isinstance(value, (int, float)):
                     value = str(int(value))
                 if isinstance(value, str) and value.strip():
@@ -728,7 +1072,7 @@ class OutputManager:
         hw_path = hw_path.strip()
         if not hw_path:
             return None
-        if os.getenv("SENDSPIN_DEBUG"):
+        if _DEBUG:
             self._logger.debug(
                 "Using bit-perfect ALSA hw path=%s for output %s",
                 hw_path,
@@ -738,7 +1082,8 @@ class OutputManager:
 
     def create_sink_for_output(self, output_id):
         if Gst is None or not output_id: return None
-        Gst.init(None)
+        _ensure_gst_init()
+        make = Gst.ElementFactory.make
         backend, pulse_device, alsa_device = self.get_effective_output_settings()
         if isinstance(output_id, str) and output_id.startswith("alsa:"):
             output_target = self.normalize_alsa_device_path(
@@ -751,7 +1096,7 @@ class OutputManager:
             return self.create_alsa_sink(target)
         for device in self._list_audio_sink_devices():
             try:
-                props = device.get_properties()
+                props = self._props_to_dict(device.get_properties())
                 display_name = device.get_display_name() or ""
                 device_class = device.get_device_class() or ""
             except Exception:
@@ -760,12 +1105,11 @@ class OutputManager:
             if device_id != output_id: continue
             is_pipewire = self.is_pipewire_device(props, device_class)
             if backend in ("pulse", "pulseaudio"):
-                prefer_pipewire = bool(os.getenv("SENDSPIN_PREFER_PIPEWIRE"))
-                if is_pipewire and prefer_pipewire:
+                if is_pipewire and _prefer_pw():
                     target = self.get_pipewire_target_object(props)
                     sink = self._create_pipewire_sink(target)
                     if sink:
-                        if os.getenv("SENDSPIN_DEBUG"):
+                        if _DEBUG:
                             if target:
                                 self._logger.info(
                                     "Using PipeWire sink target-object=%s for output %s",
@@ -778,20 +1122,16 @@ class OutputManager:
                                     output_id,
                                 )
                         return sink
-                sink = Gst.ElementFactory.make("pulsesink", None)
+                sink = make("pulsesink", None)
                 if sink:
                     target = pulse_device or self.get_pulse_device_name(props, output_id)
                     if target:
-                        try:
-                            sink.set_property("device", target)
-                            if os.getenv("SENDSPIN_DEBUG"):
-                                self._logger.info(
-                                    "Using PulseAudio sink=%s for output %s",
-                                    target,
-                                    output_id,
-                                )
-                        except Exception:
-                            pass
+                        if _set_element_property(sink, "device", target) and _DEBUG:
+                            self._logger.info(
+                                "Using PulseAudio sink=%s for output %s",
+                                target,
+                                output_id,
+                            )
                         return sink
                     if not is_pipewire:
                         alsa_target = self.get_alsa_device_path(props)
@@ -800,7 +1140,7 @@ class OutputManager:
                         if alsa_target:
                             fallback = self.create_alsa_sink(alsa_target)
                             if fallback:
-                                if os.getenv("SENDSPIN_DEBUG"):
+                                if _DEBUG:
                                     self._logger.info(
                                         "PulseAudio backend requested but output %s looks like ALSA; using ALSA sink=%s",
                                         output_id,
@@ -808,7 +1148,7 @@ class OutputManager:
                                     )
                                 return fallback
                     return sink
-                if os.getenv("SENDSPIN_DEBUG"):
+                if _DEBUG:
                     self._logger.info(
                         "PulseAudio backend requested but unavailable; falling back."
                     )
@@ -816,14 +1156,14 @@ class OutputManager:
                 target = alsa_device or self.get_alsa_device_path(props)
                 sink = self.create_alsa_sink(target)
                 if sink:
-                    if os.getenv("SENDSPIN_DEBUG") and target:
+                    if _DEBUG and target:
                         self._logger.info(
                             "Using ALSA device=%s for output %s",
                             target,
                             output_id,
                         )
                     return sink
-                if os.getenv("SENDSPIN_DEBUG"):
+                if _DEBUG:
                     self._logger.info(
                         "ALSA backend requested but unavailable; falling back."
                     )
@@ -831,17 +1171,12 @@ class OutputManager:
             except Exception: return None
             if sink and is_pipewire:
                 target = self.get_pipewire_target_object(props)
-                if target:
-                    try:
-                        sink.set_property("target-object", target)
-                        if os.getenv("SENDSPIN_DEBUG"):
-                            self._logger.info(
-                                "Using PipeWire target-object=%s for output %s",
-                                target,
-                                output_id,
-                            )
-                    except Exception:
-                        pass
+                if target and _set_element_property(sink, "target-object", target) and _DEBUG:
+                    self._logger.info(
+                        "Using PipeWire target-object=%s for output %s",
+                        target,
+                        output_id,
+                    )
             return sink
         self._logger.warning("No GStreamer sink matched output id: %s", output_id)
         return None
@@ -849,24 +1184,20 @@ class OutputManager:
     def create_default_sink(self):
         if Gst is None:
             return None
-        Gst.init(None)
+        _ensure_gst_init()
         backend, pulse_device, alsa_device = self.get_effective_output_settings()
         if backend in ("pulse", "pulseaudio"):
-            prefer_pipewire = bool(os.getenv("SENDSPIN_PREFER_PIPEWIRE"))
-            if prefer_pipewire:
-                pw_sink = self._create_pipewire_sink(os.getenv("SENDSPIN_PIPEWIRE_TARGET", "").strip() or None)
+            if _prefer_pw():
+                pw_sink = self._create_pipewire_sink(_pw_target() or None)
                 if pw_sink:
-                    if os.getenv("SENDSPIN_DEBUG"):
+                    if _DEBUG:
                         self._logger.info("Using PipeWire default sink")
                     return pw_sink
             sink = Gst.ElementFactory.make("pulsesink", None)
             if sink and pulse_device:
-                try:
-                    sink.set_property("device", pulse_device)
-                except Exception:
-                    pass
+                _set_element_property(sink, "device", pulse_device)
             if sink:
-                if os.getenv("SENDSPIN_DEBUG"):
+                if _DEBUG:
                     if pulse_device:
                         self._logger.info(
                             "Using PulseAudio default sink device=%s",
@@ -875,7 +1206,7 @@ class OutputManager:
                     else:
                         self._logger.info("Using PulseAudio default sink")
                 return sink
-            if os.getenv("SENDSPIN_DEBUG"):
+            if _DEBUG:
                 self._logger.info(
                     "PulseAudio backend requested but unavailable; using auto sink."
                 )
@@ -883,13 +1214,13 @@ class OutputManager:
         if backend == "alsa":
             sink = self.create_alsa_sink(alsa_device)
             if sink:
-                if os.getenv("SENDSPIN_DEBUG") and alsa_device:
+                if _DEBUG and alsa_device:
                     self._logger.info(
                         "Using ALSA default device=%s",
                         alsa_device,
                     )
                 return sink
-            if os.getenv("SENDSPIN_DEBUG"):
+            if _DEBUG:
                 self._logger.info(
                     "ALSA backend requested but unavailable; using auto sink."
                 )
@@ -904,33 +1235,22 @@ class OutputManager:
             return None
         target = self.normalize_alsa_device_path(target) if target else ""
         if target:
-            try:
-                sink.set_property("device", target)
-            except Exception:
-                pass
+            _set_element_property(sink, "device", target)
         return sink
 
     @staticmethod
     def get_gst_pcm_format(bit_depth):
-        if bit_depth == 16: return "S16LE"
-        if bit_depth == 24: return "S24LE"
-        if bit_depth == 32: return "S32LE"
-        return "S16LE"
+        return _PCM_FORMAT.get(bit_depth, "S16LE")
 
     @staticmethod
     def get_pipewire_target_object(props):
         if not props:
             return ""
-        override = os.getenv("SENDSPIN_PIPEWIRE_TARGET", "").strip()
+        override = _pw_target()
         if override:
             return override
-        for key in ("object.serial", "object.id", "node.name", "object.path"):
-            try:
-                if not props.has_field(key):
-                    continue
-                value = props.get_value(key)
-            except Exception:
-                continue
+        for key in _PIPEWIRE_TARGET_KEYS:
+            value = props.get(key)
             if value is None:
                 continue
             if isinstance(value, (int, float)):
@@ -949,10 +1269,7 @@ class OutputManager:
         if not sink:
             return None
         if target:
-            try:
-                sink.set_property("target-object", target)
-            except Exception:
-                pass
+            _set_element_property(sink, "target-object", target)
         return sink
 
     def _set_loading_state(self, loading, message):
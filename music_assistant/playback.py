@@ -1,54 +1,118 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import inspect
+import threading
+import time
 
 from music_assistant_client import MusicAssistantClient
 from music_assistant_client.exceptions import MusicAssistantClientException
 from music_assistant_models.enums import QueueOption
 
+try:
+    from music_assistant_models.enums import RepeatMode
+except ImportError:
+    RepeatMode = None
+
+_logger = logging.getLogger(__name__)
+_DEBUG = bool(os.environ.get("SENDSPIN_DEBUG"))
+_VOLUME_STEP = 5
+_MAX_VOLUME_STEPS = 100 // _VOLUME_STEP
+_QUEUE_DELETE_CONCURRENCY = 8
+_MEDIA_ITEM_KEYS = ("media_item", "item", "track", "media")
+_QUEUE_ITEM_ID_KEYS = ("queue_item_id", "item_id", "id")
+_GROUP_MEMBER_KEYS = ("group_members", "members", "child_player_ids")
+_IMAGE_ITEM_KEYS = (
+    "image_url",
+    "cover_image_url",
+    "image",
+    "artwork",
+    "cover",
+    "thumbnail",
+)
+_IMAGE_VALUE_KEYS = ("url", "path", "uri")
+_METADATA_IMAGE_KEYS = ("image", "images")
+_QUEUE_ITEMS_METHODS = ("get_queue_items", "items", "queue_items")
+_QUEUE_CLEAR_METHODS = ("clear", "queue_command_clear")
+_QUEUE_STEP_METHODS = ("move_up", "move_down")
+_UNGROUP_METHODS = ("ungroup_player", "ungroup", "player_command_ungroup")
+_PLAYBACK_STATE_PREFIX = "playbackstate."
+_RESOLVE_TTL = 1.0
+_PRESENT_KEYS_BY_TYPE: dict[tuple[type, tuple[str, ...]], tuple[str, ...]] = {}
+_VOLUME_LOCK = threading.Lock()
+_PENDING_VOLUMES: dict[str, int] = {}
+_SENT_VOLUMES: dict[str, int] = {}
+_VOLUME_SENDERS: set[str] = set()
+_PENDING_STEPS: dict[str, int] = {}
+_STEP_SENDERS: set[str] = set()
+_QUEUE_ITEMS_CALLS: dict[type, tuple[str, bool]] = {}
+_LAST_GOOD_TARGET: dict[tuple[int, str | None], tuple[float, str]] = {}
+_RESOLVE_CACHE: dict[tuple[int, str | None], tuple[float, tuple[str, str]]] = {}
+_REPEAT_ALIAS = (
+    {
+        "off": RepeatMode.OFF,
+        "none": RepeatMode.OFF,
+        "disabled": RepeatMode.OFF,
+        "one": RepeatMode.ONE,
+        "track": RepeatMode.ONE,
+        "single": RepeatMode.ONE,
+        "all": RepeatMode.ALL,
+        "playlist": RepeatMode.ALL,
+    }
+    if RepeatMode is not None
+    else {}
+)
+
+
+def _source_ref_uri(source: object) -> object:
+    if isinstance(source, dict):
+        return source.get("uri") or source.get("source_uri")
+    if source is not None:
+        return getattr(source, "uri", None) or getattr(source, "source_uri", None)
+    return None
+
+
+def _dict_source_uri(item: dict) -> object:
+    uri = item.get("source_uri") or _source_ref_uri(item.get("source"))
+    return uri.strip() if isinstance(uri, str) else uri
+
+
+def _media_source_uri(item: object) -> object:
+    if isinstance(item, dict):
+        return _dict_source_uri(item)
+    uri = getattr(item, "source_uri", None) or _source_ref_uri(
+        getattr(item, "source", None)
+    )
+    return uri.strip() if isinstance(uri, str) else uri
+
 
 def build_media_uri_list(tracks: list[dict]) -> list[str]:
     if not tracks:
         return []
-    uris = []
-    for item in tracks:
-        if isinstance(item, dict):
-            uri = item.get("source_uri")
-            if not uri:
-                source = item.get("source")
-                if isinstance(source, dict):
-                    uri = source.get("uri") or source.get("source_uri")
-                elif source is not None:
-                    uri = getattr(source, "uri", None) or getattr(
-                        source, "source_uri", None
-                    )
-        else:
-            uri = getattr(item, "source_uri", None)
-            if not uri:
-                source = getattr(item, "source", None)
-                if isinstance(source, dict):
-                    uri = source.get("uri") or source.get("source_uri")
-                elif source is not None:
-                    uri = getattr(source, "uri", None) or getattr(
-                        source, "source_uri", None
-                    )
-        if isinstance(uri, str):
-            uri = uri.strip()
-        if not uri:
-            return []
-        uris.append(uri)
-    return uris
+    # Track lists are homogeneous in practice; pick the extractor from the
+    # first entry and only fall back to per-item dispatch on a mixed list.
+    if isinstance(tracks[0], dict):
+        try:
+            uris = [_dict_source_uri(item) for item in tracks]
+        except AttributeError:
+            uris = [_media_source_uri(item) for item in tracks]
+    else:
+        uris = [_media_source_uri(item) for item in tracks]
+    return uris if all(uris) else []
 
 
 def _normalize_queue_state(state: object) -> str:
     if state is None:
         return ""
     value = getattr(state, "value", state)
-    text = str(value).casefold()
-    if text.startswith("playbackstate."):
-        return text.split(".", 1)[1]
+    if type(value) is str:
+        text = value if value.islower() else value.casefold()
+    else:
+        text = str(value).casefold()
+    if text.startswith(_PLAYBACK_STATE_PREFIX):
+        return text[len(_PLAYBACK_STATE_PREFIX):]
     return text
 
 
@@ -60,6 +124,25 @@ def _get_media_attr(item: object | None, key: str) -> object | None:
     return getattr(item, key, None)
 
 
+def _first_media_attr(item: object | None, keys: tuple[str, ...]) -> object | None:
+    # Same result as chaining _get_media_attr(...) with `or`, but the
+    # dict/object dispatch happens once per item instead of once per key.
+    value = None
+    if item is None:
+        return value
+    if isinstance(item, dict):
+        for key in keys:
+            value = item.get(key)
+            if value:
+                return value
+        return value
+    for key in keys:
+        value = getattr(item, key, None)
+        if value:
+            return value
+    return value
+
+
 def _normalize_player_id(value: object | None) -> str | None:
     if value is None:
         return None
@@ -74,15 +157,16 @@ def _extract_group_member_ids(player: object | None) -> set[str]:
         return set()
     members: set[str] = set()
     raw_members = (
-        _get_media_attr(player, "group_members")
-        or _get_media_attr(player, "members")
-        or _get_media_attr(player, "child_player_ids")
+        _first_media_attr(player, _GROUP_MEMBER_KEYS)
         or []
     )
     for member in raw_members:
-        member_id = _normalize_player_id(
-            _get_media_attr(member, "player_id") if member is not None else None
-        ) or _normalize_player_id(member)
+        if isinstance(member, str):
+            member_id = _normalize_player_id(member)
+        else:
+            member_id = _normalize_player_id(
+                _get_media_attr(member, "player_id")
+            ) or _normalize_player_id(member)
         if member_id:
             members.add(member_id)
     player_id = _normalize_player_id(_get_media_attr(player, "player_id"))
@@ -91,8 +175,21 @@ def _extract_group_member_ids(player: object | None) -> set[str]:
     return members
 
 
+def _present_keys(item: object, keys: tuple[str, ...]) -> tuple[str, ...]:
+    # Model objects share one attribute layout per class, so remember which
+    # of the candidate keys a type actually has and skip the missing ones.
+    if isinstance(item, dict):
+        return keys
+    cache_key = (type(item), keys)
+    present = _PRESENT_KEYS_BY_TYPE.get(cache_key)
+    if present is None:
+        present = tuple(key for key in keys if hasattr(item, key))
+        _PRESENT_KEYS_BY_TYPE[cache_key] = present
+    return present
+
+
 def _extract_queue_media_item(item: object) -> object:
-    for key in ("media_item", "item", "track", "media"):
+    for key in _present_keys(item, _MEDIA_ITEM_KEYS):
         candidate = _get_media_attr(item, key)
         if candidate:
             return candidate
@@ -100,17 +197,13 @@ def _extract_queue_media_item(item: object) -> object:
 
 
 def _normalize_queue_artist(media_item: object) -> str:
-    artist = _get_media_attr(media_item, "artist_str") or _get_media_attr(
-        media_item, "artist"
-    )
+    artist = _first_media_attr(media_item, ("artist_str", "artist"))
     if artist:
         return str(artist)
     artists = _get_media_attr(media_item, "artists") or []
     names: list[str] = []
     for entry in artists:
-        name = _get_media_attr(entry, "name") or _get_media_attr(
-            entry, "sort_name"
-        )
+        name = _first_media_attr(entry, ("name", "sort_name"))
         if name:
             names.append(str(name))
     return ", ".join(names)
@@ -123,7 +216,7 @@ def _iter_image_candidates(value: object):
             yield candidate
         return
     if isinstance(value, dict):
-        for key in ("url", "path", "uri"):
+        for key in _IMAGE_VALUE_KEYS:
             candidate = value.get(key)
             if isinstance(candidate, str):
                 normalized = candidate.strip()
@@ -134,7 +227,7 @@ def _iter_image_candidates(value: object):
         for item in value:
             yield from _iter_image_candidates(item)
         return
-    for key in ("url", "path", "uri"):
+    for key in _IMAGE_VALUE_KEYS:
         candidate = getattr(value, key, None)
         if isinstance(candidate, str):
             normalized = candidate.strip()
@@ -143,50 +236,36 @@ def _iter_image_candidates(value: object):
 
 
 def _extract_queue_image_url(media_item: object) -> str | None:
-    to_scan = [media_item]
-    visited: set[int] = set()
-    while to_scan:
-        candidate_item = to_scan.pop(0)
-        marker = id(candidate_item)
-        if marker in visited:
-            continue
-        visited.add(marker)
-        for key in (
-            "image_url",
-            "cover_image_url",
-            "image",
-            "artwork",
-            "cover",
-            "thumbnail",
+    image_url = _find_item_image_url(media_item)
+    if image_url is not None:
+        return image_url
+    album = _get_media_attr(media_item, "album")
+    if album is not None and album is not media_item:
+        return _find_item_image_url(album)
+    return None
+
+
+def _find_item_image_url(candidate_item: object) -> str | None:
+    for key in _present_keys(candidate_item, _IMAGE_ITEM_KEYS):
+        for image_url in _iter_image_candidates(
+            _get_media_attr(candidate_item, key)
         ):
+            return image_url
+    metadata = _get_media_attr(candidate_item, "metadata")
+    if metadata is not None:
+        for key in _METADATA_IMAGE_KEYS:
             for image_url in _iter_image_candidates(
-                _get_media_attr(candidate_item, key)
+                _get_media_attr(metadata, key)
             ):
                 return image_url
-        metadata = _get_media_attr(candidate_item, "metadata")
-        if metadata is not None:
-            for key in ("image", "images"):
-                for image_url in _iter_image_candidates(
-                    _get_media_attr(metadata, key)
-                ):
-                    return image_url
-        album = _get_media_attr(candidate_item, "album")
-        if album is not None and album is not candidate_item:
-            to_scan.append(album)
     return None
 
 
 def _serialize_queue_item(item: object, index: int) -> dict:
     media_item = _extract_queue_media_item(item)
-    title = _get_media_attr(media_item, "name") or _get_media_attr(
-        media_item, "title"
-    )
-    if not title:
-        title = "Unknown Track"
+    title = _first_media_attr(media_item, ("name", "title")) or "Unknown Track"
     duration = (
-        _get_media_attr(media_item, "duration")
-        or _get_media_attr(media_item, "length_seconds")
-        or _get_media_attr(media_item, "length")
+        _first_media_attr(media_item, ("duration", "length_seconds", "length"))
         or 0
     )
     try:
@@ -194,11 +273,7 @@ def _serialize_queue_item(item: object, index: int) -> dict:
     except (TypeError, ValueError):
         duration_seconds = 0
     uri = _get_media_attr(media_item, "uri") or _get_media_attr(item, "uri")
-    queue_item_id = (
-        _get_media_attr(item, "queue_item_id")
-        or _get_media_attr(item, "item_id")
-        or _get_media_attr(item, "id")
-    )
+    queue_item_id = _first_media_attr(item, _QUEUE_ITEM_ID_KEYS)
     image_url = _extract_queue_image_url(media_item)
     return {
         "index": index,
@@ -211,65 +286,75 @@ def _serialize_queue_item(item: object, index: int) -> dict:
     }
 
 
+def _serialize_queue_items(items: list[object]) -> list[dict]:
+    serialize = _serialize_queue_item
+    return [serialize(item, index) for index, item in enumerate(items)]
+
+
+def invalidate_resolve_cache() -> None:
+    _RESOLVE_CACHE.clear()
+    _LAST_GOOD_TARGET.clear()
+
+
 async def resolve_player_and_queue(
     client: MusicAssistantClient, preferred_player_id: str | None
+) -> tuple[str, str]:
+    key = (id(client), preferred_player_id)
+    cached = _RESOLVE_CACHE.get(key)
+    now = time.monotonic()
+    if cached and now - cached[0] < _RESOLVE_TTL:
+        return cached[1]
+    target = await _resolve_player_and_queue(client, preferred_player_id)
+    if len(_RESOLVE_CACHE) >= 16:
+        _RESOLVE_CACHE.clear()
+    _RESOLVE_CACHE[key] = (now, target)
+    return target
+
+
+async def _resolve_player_and_queue(
+    client: MusicAssistantClient, preferred_player_id: str | None
 ) -> tuple[str, str]:
     if preferred_player_id:
-        cached_players = list(client.players.players)
-        if cached_players:
-            player = next(
-                (
-                    candidate
-                    for candidate in cached_players
-                    if candidate.player_id == preferred_player_id
-                    and candidate.available
-                    and candidate.enabled
-                ),
-                None,
+        player = client.players.get(preferred_player_id)
+        if player and player.available and player.enabled:
+            queue = await client.player_queues.get_active_queue(
+                player.player_id
             )
-            if player:
-                queue = await client.player_queues.get_active_queue(
-                    player.player_id
+            queue_id = queue.queue_id if queue else player.player_id
+            if _DEBUG:
+                _logger.info(
+                    "Resolved playback target: player=%s queue=%s",
+                    player.player_id,
+                    queue_id,
                 )
-                queue_id = queue.queue_id if queue else player.player_id
-                if os.getenv("SENDSPIN_DEBUG"):
-                    logging.getLogger(__name__).info(
-                        "Resolved playback target: player=%s queue=%s",
-                        player.player_id,
-                        queue_id,
-                    )
-                return player.player_id, queue_id
+            return player.player_id, queue_id
 
     # Fall back to full state refresh.
-    await client.players.fetch_state()
-    await client.player_queues.fetch_state()
-    players = [
-        player
+    await asyncio.gather(
+        client.players.fetch_state(),
+        client.player_queues.fetch_state(),
+    )
+    players_by_id = {
+        player.player_id: player
         for player in client.players.players
         if player.available and player.enabled
-    ]
-    if not players:
+    }
+    if not players_by_id:
         raise MusicAssistantClientException("No available players")
+    first_player = next(iter(players_by_id.values()))
     if preferred_player_id:
-        player = next(
-            (
-                candidate
-                for candidate in players
-                if candidate.player_id == preferred_player_id
-            ),
-            players[0],
-        )
-        if os.getenv("SENDSPIN_DEBUG") and player.player_id != preferred_player_id:
-            logging.getLogger(__name__).info(
+        player = players_by_id.get(preferred_player_id) or first_player
+        if _DEBUG and player.player_id != preferred_player_id:
+            _logger.info(
                 "Preferred output unavailable; using %s instead.",
                 player.player_id,
             )
     else:
-        player = players[0]
+        player = first_player
     queue = await client.player_queues.get_active_queue(player.player_id)
     queue_id = queue.queue_id if queue else player.player_id
-    if os.getenv("SENDSPIN_DEBUG"):
-        logging.getLogger(__name__).info(
+    if _DEBUG:
+        _logger.info(
             "Resolved playback target: player=%s queue=%s",
             player.player_id,
             queue_id,
@@ -286,8 +371,8 @@ async def _play_album_async(
     player_id, queue_id = await resolve_player_and_queue(
         client, preferred_player_id
     )
-    if os.getenv("SENDSPIN_DEBUG"):
-        logging.getLogger(__name__).info(
+    if _DEBUG:
+        _logger.info(
             "Sending play_media to queue=%s (player=%s).",
             queue_id,
             player_id,
@@ -298,13 +383,13 @@ async def _play_album_async(
         option=QueueOption.REPLACE,
         start_item=start_item,
     )
-    if os.getenv("SENDSPIN_DEBUG"):
+    if _DEBUG:
         queue = None
         try:
             queue = await client.player_queues.get_active_queue(player_id)
         except Exception:
             queue = None
-        logging.getLogger(__name__).info(
+        _logger.info(
             "Queue state after play_media: state=%s elapsed=%s current_item=%s",
             getattr(queue, "state", None) if queue else None,
             getattr(queue, "elapsed_time", None) if queue else None,
@@ -431,6 +516,7 @@ async def _playback_command_async(
     preferred_player_id: str | None,
     position: int | None,
 ) -> None:
+    last_good_key = (id(client), preferred_player_id)
     if preferred_player_id:
         try:
             await _send_player_command(
@@ -439,18 +525,38 @@ async def _playback_command_async(
                 preferred_player_id,
                 position,
             )
+            _LAST_GOOD_TARGET.pop(last_good_key, None)
             return
         except MusicAssistantClientException as exc:
-            if os.getenv("SENDSPIN_DEBUG"):
-                logging.getLogger(__name__).info(
+            # Keep the last-good fallback; it is what we try next.
+            _RESOLVE_CACHE.clear()
+            if _DEBUG:
+                _logger.info(
                     "Playback command fast-path failed for %s: %s",
                     preferred_player_id,
                     exc,
                 )
+        # Retry the player the last full resolve fell back to before
+        # paying for another state refresh.
+        entry = _LAST_GOOD_TARGET.pop(last_good_key, None)
+        last_good = None
+        if entry and time.monotonic() - entry[0] < _RESOLVE_TTL:
+            last_good = entry[1]
+        if last_good and last_good != preferred_player_id:
+            try:
+                await _send_player_command(client, command, last_good, position)
+                # Keep the original stamp so the substitute still expires.
+                _LAST_GOOD_TARGET[last_good_key] = entry
+                return
+            except MusicAssistantClientException:
+                pass
     player_id, _queue_id = await resolve_player_and_queue(
         client, preferred_player_id
     )
     await _send_player_command(client, command, player_id, position)
+    if len(_LAST_GOOD_TARGET) >= 16:
+        _LAST_GOOD_TARGET.clear()
+    _LAST_GOOD_TARGET[last_good_key] = (time.monotonic(), player_id)
 
 
 async def _send_player_command(
@@ -459,35 +565,28 @@ async def _send_player_command(
     player_id: str,
     position: int | None,
 ) -> None:
-    if command == "pause":
-        await client.players.pause(player_id)
-    elif command in ("play", "resume"):
-        await client.players.play(player_id)
-    elif command == "next":
-        await client.players.next_track(player_id)
-    elif command == "previous":
-        await client.players.previous_track(player_id)
-    elif command == "stop":
-        await client.players.stop(player_id)
-    elif command == "seek" and position is not None:
-        await client.players.seek(player_id, position)
+    handler = _COMMAND_TABLE.get(command)
+    if handler is None or (command == "seek" and position is None):
+        return
+    await handler(client.players, player_id, position)
+
+
+_COMMAND_TABLE = {
+    "pause": lambda players, player_id, _position: players.pause(player_id),
+    "play": lambda players, player_id, _position: players.play(player_id),
+    "next": lambda players, player_id, _position: players.next_track(player_id),
+    "previous": lambda players, player_id, _position: players.previous_track(
+        player_id
+    ),
+    "stop": lambda players, player_id, _position: players.stop(player_id),
+    "seek": lambda players, player_id, position: players.seek(player_id, position),
+}
+_COMMAND_TABLE["resume"] = _COMMAND_TABLE["play"]
 
 
 def _coerce_repeat_mode(value: object):
-    try:
-        from music_assistant_models.enums import RepeatMode
-    except Exception:
-        return value
-    if isinstance(value, RepeatMode):
-        return value
     if isinstance(value, str):
-        text = value.casefold()
-        if text in ("off", "none", "disabled"):
-            return RepeatMode.OFF
-        if text in ("one", "track", "single"):
-            return RepeatMode.ONE
-        if text in ("all", "playlist"):
-            return RepeatMode.ALL
+        return _REPEAT_ALIAS.get(value.casefold(), value)
     return value
 
 
@@ -543,17 +642,34 @@ async def _get_queue_items(
         except TypeError:
             return []
 
-    for method_name in ("get_queue_items", "items", "queue_items"):
-        fetch_method = getattr(client.player_queues, method_name, None)
+    player_queues = client.player_queues
+    api_key = type(player_queues)
+    cached_call = _QUEUE_ITEMS_CALLS.get(api_key)
+    if cached_call is not None:
+        method_name, by_keyword = cached_call
+        fetch_method = getattr(player_queues, method_name)
+        if by_keyword:
+            result = fetch_method(queue_id=queue_id)
+        else:
+            result = fetch_method(queue_id)
+        if inspect.isawaitable(result):
+            result = await result
+        return _coerce_queue_items_result(result)
+
+    for method_name in _present_keys(player_queues, _QUEUE_ITEMS_METHODS):
+        fetch_method = getattr(player_queues, method_name, None)
         if not callable(fetch_method):
             continue
+        by_keyword = False
         try:
             result = fetch_method(queue_id)
         except TypeError:
             try:
                 result = fetch_method(queue_id=queue_id)
+                by_keyword = True
             except TypeError:
                 continue
+        _QUEUE_ITEMS_CALLS[api_key] = (method_name, by_keyword)
         if inspect.isawaitable(result):
             result = await result
         return _coerce_queue_items_result(result)
@@ -582,11 +698,7 @@ async def _fetch_queue_items_async(
     _player_id, queue_id = await resolve_player_and_queue(
         client, preferred_player_id
     )
-    queue_items = await _get_queue_items(client, queue_id)
-    return [
-        _serialize_queue_item(item, index)
-        for index, item in enumerate(queue_items)
-    ]
+    return _serialize_queue_items(await _get_queue_items(client, queue_id))
 
 
 async def _delete_queue_item_async(
@@ -607,28 +719,29 @@ async def _clear_queue_async(
     _player_id, queue_id = await resolve_player_and_queue(
         client, preferred_player_id
     )
-    clear_method = getattr(client.player_queues, "clear", None)
-    if callable(clear_method):
-        result = clear_method(queue_id)
-        if inspect.isawaitable(result):
-            await result
-        return
-    clear_method = getattr(client.player_queues, "queue_command_clear", None)
-    if callable(clear_method):
-        result = clear_method(queue_id)
-        if inspect.isawaitable(result):
-            await result
-        return
+    for method_name in _present_keys(client.player_queues, _QUEUE_CLEAR_METHODS):
+        clear_method = getattr(client.player_queues, method_name, None)
+        if callable(clear_method):
+            result = clear_method(queue_id)
+            if inspect.isawaitable(result):
+                await result
+            return
     queue_items = await _get_queue_items(client, queue_id)
+    item_ids = []
     for item in queue_items:
-        item_id = (
-            _get_media_attr(item, "queue_item_id")
-            or _get_media_attr(item, "item_id")
-            or _get_media_attr(item, "id")
-        )
+        item_id = _first_media_attr(item, _QUEUE_ITEM_ID_KEYS)
         if item_id is None:
             continue
-        await client.player_queues.delete_item(queue_id, str(item_id))
+        item_ids.append(str(item_id))
+    if not item_ids:
+        return
+    semaphore = asyncio.Semaphore(_QUEUE_DELETE_CONCURRENCY)
+
+    async def _delete(item_id: str) -> None:
+        async with semaphore:
+            await client.player_queues.delete_item(queue_id, item_id)
+
+    await asyncio.gather(*(_delete(item_id) for item_id in item_ids))
 
 
 async def _move_queue_item_async(
@@ -643,12 +756,13 @@ async def _move_queue_item_async(
     _player_id, queue_id = await resolve_player_and_queue(
         client, preferred_player_id
     )
-    if pos_shift < 0 and hasattr(client.player_queues, "move_up"):
-        await client.player_queues.move_up(queue_id, queue_item_id)
-        return
-    if pos_shift > 0 and hasattr(client.player_queues, "move_down"):
-        await client.player_queues.move_down(queue_id, queue_item_id)
-        return
+    if pos_shift in (-1, 1):
+        # Single-step moves have dedicated commands; larger shifts must go
+        # through move_item or they would only move the item by one.
+        step_method = "move_up" if pos_shift < 0 else "move_down"
+        if step_method in _present_keys(client.player_queues, _QUEUE_STEP_METHODS):
+            await getattr(client.player_queues, step_method)(queue_id, queue_item_id)
+            return
     await client.player_queues.move_item(queue_id, queue_item_id, pos_shift)
 
 
@@ -658,8 +772,10 @@ async def _transfer_queue_async(
     target_player_id: str,
     auto_play: bool | None,
 ) -> None:
-    await client.players.fetch_state()
-    await client.player_queues.fetch_state()
+    await asyncio.gather(
+        client.players.fetch_state(),
+        client.player_queues.fetch_state(),
+    )
     source_player = client.players.get(source_player_id)
     target_player = client.players.get(target_player_id)
     if not source_player:
@@ -670,11 +786,9 @@ async def _transfer_queue_async(
         raise MusicAssistantClientException(
             f"Target output unavailable: {target_player_id}"
         )
-    source_queue = await client.player_queues.get_active_queue(
-        source_player_id
-    )
-    target_queue = await client.player_queues.get_active_queue(
-        target_player_id
+    source_queue, target_queue = await asyncio.gather(
+        client.player_queues.get_active_queue(source_player_id),
+        client.player_queues.get_active_queue(target_player_id),
     )
     source_queue_id = (
         source_queue.queue_id if source_queue else source_player_id
@@ -684,6 +798,7 @@ async def _transfer_queue_async(
     )
     if source_queue_id == target_queue_id:
         return
+    invalidate_resolve_cache()
     await client.player_queues.transfer(
         source_queue_id,
         target_queue_id,
@@ -699,26 +814,19 @@ async def _group_players_async(
     normalized_player_id = _normalize_player_id(player_id)
     if not normalized_player_id:
         raise MusicAssistantClientException("Invalid player id")
-    normalized_group_members = sorted(
-        {
-            candidate
-            for candidate in (
-                _normalize_player_id(member_id)
-                for member_id in group_member_ids
-            )
-            if candidate and candidate != normalized_player_id
-        }
-    )
+    invalidate_resolve_cache()
+    forget_sent_volumes()
+    desired_members = {
+        candidate
+        for candidate in map(_normalize_player_id, group_member_ids)
+        if candidate and candidate != normalized_player_id
+    }
     if hasattr(client.players, "set_members"):
         await client.players.fetch_state()
         current_player = client.players.get(normalized_player_id)
         current_members = _extract_group_member_ids(current_player)
-        members_to_add = sorted(
-            set(normalized_group_members) - set(current_members)
-        )
-        members_to_remove = sorted(
-            set(current_members) - set(normalized_group_members)
-        )
+        members_to_add = sorted(desired_members - current_members)
+        members_to_remove = sorted(current_members - desired_members)
         result = client.players.set_members(
             normalized_player_id,
             members_to_add or None,
@@ -729,21 +837,19 @@ async def _group_players_async(
         return
     if hasattr(client.players, "group_players"):
         await client.players.group_players(
-            normalized_player_id, normalized_group_members
+            normalized_player_id, sorted(desired_members)
         )
         return
     if hasattr(client.players, "group_many"):
         await client.players.group_many(
-            normalized_player_id, normalized_group_members
+            normalized_player_id, sorted(desired_members)
         )
         return
     if hasattr(client.players, "group"):
         await client.players.fetch_state()
         current_player = client.players.get(normalized_player_id)
         current_members = _extract_group_member_ids(current_player)
-        for member_id in sorted(
-            set(normalized_group_members) - set(current_members)
-        ):
+        for member_id in sorted(desired_members - current_members):
             await client.players.group(member_id, normalized_player_id)
         return
     raise MusicAssistantClientException("Player grouping is not supported")
@@ -753,14 +859,10 @@ async def _ungroup_player_async(
     client: MusicAssistantClient,
     player_id: str,
 ) -> None:
-    if hasattr(client.players, "ungroup_player"):
-        await client.players.ungroup_player(player_id)
-        return
-    if hasattr(client.players, "ungroup"):
-        await client.players.ungroup(player_id)
-        return
-    if hasattr(client.players, "player_command_ungroup"):
-        await client.players.player_command_ungroup(player_id)
+    invalidate_resolve_cache()
+    forget_sent_volumes()
+    for method_name in _present_keys(client.players, _UNGROUP_METHODS):
+        await getattr(client.players, method_name)(player_id)
         return
     raise MusicAssistantClientException("Player ungrouping is not supported")
 
@@ -773,20 +875,28 @@ async def _fetch_group_member_ids_async(
     if not player_id:
         return []
     await client.players.fetch_state()
-    players = list(getattr(client.players, "players", []) or [])
-    players_by_id = {
-        candidate_id: player
-        for player in players
-        for candidate_id in [
-            _normalize_player_id(_get_media_attr(player, "player_id"))
-        ]
-        if candidate_id
-    }
+    players_by_id = {}
+    followers: set[str] = set()
+    for player in getattr(client.players, "players", None) or []:
+        candidate_id = _normalize_player_id(_get_media_attr(player, "player_id"))
+        if not candidate_id:
+            continue
+        players_by_id[candidate_id] = player
+        if candidate_id == player_id:
+            continue
+        if (
+            _normalize_player_id(_get_media_attr(player, "active_group"))
+            == player_id
+            or _normalize_player_id(_get_media_attr(player, "synced_to"))
+            == player_id
+        ):
+            followers.add(candidate_id)
     selected_player = players_by_id.get(player_id)
     if selected_player is None:
         return []
 
     member_ids = _extract_group_member_ids(selected_player)
+    member_ids |= followers
     active_group_id = _normalize_player_id(
         _get_media_attr(selected_player, "active_group")
     )
@@ -798,20 +908,6 @@ async def _fetch_group_member_ids_async(
             continue
         member_ids.add(group_owner_id)
         member_ids.update(_extract_group_member_ids(players_by_id.get(group_owner_id)))
-
-    for player in players:
-        candidate_id = _normalize_player_id(
-            _get_media_attr(player, "player_id")
-        )
-        if not candidate_id or candidate_id == player_id:
-            continue
-        if (
-            _normalize_player_id(_get_media_attr(player, "active_group"))
-            == player_id
-        ):
-            member_ids.add(candidate_id)
-        if _normalize_player_id(_get_media_attr(player, "synced_to")) == player_id:
-            member_ids.add(candidate_id)
     member_ids.discard(player_id)
     return sorted(member_ids)
 
@@ -1052,7 +1148,55 @@ async def _volume_command_async(
     player_id: str,
     volume: int,
 ) -> None:
-    await client.players.volume_set(player_id, volume)
+    # Skip only when this module last sent the same level and the server
+    # state agrees. The cached state alone can lag behind the ack, so a
+    # reversed drag (50 -> 60 -> 50) must still send the final 50.
+    with _VOLUME_LOCK:
+        last_sent = _SENT_VOLUMES.get(player_id)
+    if (
+        last_sent == volume
+        and _get_media_attr(client.players.get(player_id), "volume_level")
+        == volume
+    ):
+        return
+    try:
+        await client.players.volume_set(player_id, volume)
+    except BaseException:
+        forget_sent_volumes(player_id)
+        raise
+    with _VOLUME_LOCK:
+        _SENT_VOLUMES[player_id] = volume
+
+
+def forget_sent_volumes(player_id: str | None = None) -> None:
+    with _VOLUME_LOCK:
+        if player_id is None:
+            _SENT_VOLUMES.clear()
+        else:
+            _SENT_VOLUMES.pop(player_id, None)
+
+
+def note_player_volume(player_id: str | None, volume_level: object) -> None:
+    # Called with levels reported by the server; anything other than what
+    # we last sent means another controller moved the volume.
+    if not player_id:
+        return
+    with _VOLUME_LOCK:
+        last_sent = _SENT_VOLUMES.get(player_id)
+        if last_sent is not None and last_sent != volume_level:
+            del _SENT_VOLUMES[player_id]
+
+
+async def _bulk_volume_async(
+    client: MusicAssistantClient,
+    levels: dict[str, int],
+) -> None:
+    await asyncio.gather(
+        *(
+            _volume_command_async(client, player_id, volume)
+            for player_id, volume in levels.items()
+        )
+    )
 
 
 async def _volume_step_async(
@@ -1063,12 +1207,133 @@ async def _volume_step_async(
 ) -> None:
     if direction == 0 or steps <= 0:
         return
-    if direction > 0:
-        for _ in range(steps):
-            await client.players.volume_up(player_id)
-    else:
-        for _ in range(steps):
-            await client.players.volume_down(player_id)
+    # Later bursts build on the level this module last sent; the client
+    # cache would still hold the level from before the previous burst.
+    with _VOLUME_LOCK:
+        current = _SENT_VOLUMES.get(player_id)
+    if current is None:
+        # The session client does not listen for events, so its player
+        # cache only moves on fetch_state; refresh it before using it.
+        try:
+            await client.players.fetch_state()
+        except MusicAssistantClientException as exc:
+            if _DEBUG:
+                _logger.info(
+                    "Volume state refresh failed for %s: %s", player_id, exc
+                )
+        else:
+            current = _get_media_attr(
+                client.players.get(player_id), "volume_level"
+            )
+    if isinstance(current, (int, float)):
+        room = 100 - current if direction > 0 else current
+        if room <= 0:
+            return
+        # Steps past the end of the range would be clamped by the server.
+        steps = min(steps, -(-int(room) // _VOLUME_STEP))
+        delta = _VOLUME_STEP * steps if direction > 0 else -_VOLUME_STEP * steps
+        target = int(max(0, min(100, current + delta)))
+        try:
+            await client.players.volume_set(player_id, target)
+        except MusicAssistantClientException as exc:
+            if _DEBUG:
+                _logger.info(
+                    "Absolute volume set failed for %s: %s", player_id, exc
+                )
+        except BaseException:
+            forget_sent_volumes(player_id)
+            raise
+        else:
+            with _VOLUME_LOCK:
+                _SENT_VOLUMES[player_id] = target
+            return
+    # Relative steps leave the resulting level unknown.
+    forget_sent_volumes(player_id)
+    step = client.players.volume_up if direction > 0 else client.players.volume_down
+    await asyncio.gather(
+        *(step(player_id) for _ in range(min(steps, _MAX_VOLUME_STEPS)))
+    )
+
+
+async def _drain_player_volume_async(
+    client: MusicAssistantClient,
+    player_id: str,
+) -> None:
+    # Send the newest requested level until no newer one has arrived; values
+    # superseded while a request was in flight are never sent.
+    while True:
+        with _VOLUME_LOCK:
+            volume = _PENDING_VOLUMES.pop(player_id, None)
+            if volume is None:
+                _VOLUME_SENDERS.discard(player_id)
+                return
+        try:
+            await _volume_command_async(client, player_id, volume)
+        except BaseException:
+            # Keep the level for the session's reconnect retry unless a
+            # newer one has already been queued.
+            with _VOLUME_LOCK:
+                _PENDING_VOLUMES.setdefault(player_id, volume)
+            raise
+
+
+async def _drain_player_steps_async(
+    client: MusicAssistantClient,
+    player_id: str,
+) -> None:
+    # Steps requested while a change was in flight are summed and applied
+    # as one net change.
+    while True:
+        with _VOLUME_LOCK:
+            delta = _PENDING_STEPS.pop(player_id, 0)
+            if delta == 0:
+                _STEP_SENDERS.discard(player_id)
+                return
+        # A failed relative step is dropped rather than re-queued; replaying
+        # it on the next scroll would jump the volume by the stale amount.
+        await _volume_step_async(client, player_id, delta, abs(delta))
+
+
+def _start_volume_drain(
+    client_session,
+    server_url: str,
+    auth_token: str,
+    drain_async,
+    senders: set[str],
+    player_id: str,
+    blocking: bool,
+) -> None:
+    try:
+        if blocking:
+            client_session.run(server_url, auth_token, drain_async, player_id)
+            return
+        future = client_session.submit(
+            server_url, auth_token, drain_async, player_id
+        )
+    except BaseException:
+        _release_volume_sender(senders, player_id)
+        raise
+    future.add_done_callback(
+        lambda done: _on_volume_drain_done(done, senders, player_id)
+    )
+
+
+def _release_volume_sender(senders: set[str], player_id: str) -> None:
+    with _VOLUME_LOCK:
+        senders.discard(player_id)
+        if senders is _STEP_SENDERS:
+            _PENDING_STEPS.pop(player_id, None)
+
+
+def _on_volume_drain_done(future, senders: set[str], player_id: str) -> None:
+    cancelled = future.cancelled()
+    if not cancelled and future.exception() is None:
+        return
+    _release_volume_sender(senders, player_id)
+    if not cancelled:
+        _logger.warning(
+            "Volume update for %s failed: %s", player_id, future.exception()
+        )
 
 
 def set_player_volume(
@@ -1077,13 +1342,37 @@ def set_player_volume(
     auth_token: str,
     player_id: str,
     volume: int,
+    blocking: bool = False,
 ) -> None:
-    client_session.run(
+    with _VOLUME_LOCK:
+        _PENDING_VOLUMES[player_id] = volume
+        if player_id in _VOLUME_SENDERS:
+            return
+        _VOLUME_SENDERS.add(player_id)
+    _start_volume_drain(
+        client_session,
         server_url,
         auth_token,
-        _volume_command_async,
+        _drain_player_volume_async,
+        _VOLUME_SENDERS,
         player_id,
-        volume,
+        blocking,
+    )
+
+
+def set_player_volumes_bulk(
+    client_session,
+    server_url: str,
+    auth_token: str,
+    levels: dict[str, int],
+) -> None:
+    if not levels:
+        return
+    client_session.run(
+        server_url,
+        auth_token,
+        _bulk_volume_async,
+        dict(levels),
     )
 
 
@@ -1094,16 +1383,25 @@ def step_player_volume(
     player_id: str,
     direction: int,
     steps: int,
+    blocking: bool = False,
 ) -> None:
     if direction == 0 or steps <= 0:
         return
-    client_session.run(
+    with _VOLUME_LOCK:
+        _PENDING_STEPS[player_id] = _PENDING_STEPS.get(player_id, 0) + (
+            steps if direction > 0 else -steps
+        )
+        if player_id in _STEP_SENDERS:
+            return
+        _STEP_SENDERS.add(player_id)
+    _start_volume_drain(
+        client_session,
         server_url,
         auth_token,
-        _volume_step_async,
+        _drain_player_steps_async,
+        _STEP_SENDERS,
         player_id,
-        direction,
-        steps,
+        blocking,
     )
 
 
@@ -1126,7 +1424,11 @@ __all__ = [
     "set_queue_shuffle",
     "transfer_queue",
     "set_player_volume",
+    "set_player_volumes_bulk",
     "step_player_volume",
+    "forget_sent_volumes",
+    "note_player_volume",
     "resolve_player_and_queue",
+    "invalidate_resolve_cache",
     "build_media_uri_list",
 ]
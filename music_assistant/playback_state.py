@@ -1,6 +1,7 @@
 """Playback state management and queue helpers."""
 
 import asyncio
+import functools
 import logging
 import os
 import threading
@@ -18,6 +19,12 @@ from ui.widgets.track_row import TrackRow
 
 
 PLAYBACK_PENDING_GRACE_SECONDS = 5.0
+SEEK_DEBOUNCE_MS = 120
+_LISTENER_RETRY_MIN_SECONDS = 1.0
+_LISTENER_RETRY_MAX_SECONDS = 30.0
+_PLAYBACK_STATE_PREFIX = "playbackstate."
+_logger = logging.getLogger(__name__)
+_DEBUG = bool(os.environ.get("SENDSPIN_DEBUG"))
 
 
 def start_playback_from_track(app, track: TrackRow) -> None:
@@ -27,11 +34,27 @@ def start_playback_from_track(app, track: TrackRow) -> None:
         index = app.current_album_tracks.index(track)
     except ValueError:
         return
-    app.playback_album = app.current_album
-    app.playback_album_tracks = [
-        track_utils.snapshot_track(item, track_utils.get_track_identity)
-        for item in app.current_album_tracks
-    ]
+    tracks = app.current_album_tracks
+    cached = app._playback_snapshot_source
+    # Successive clicks in the same list reuse the snapshots from the
+    # first click unless the list, its length or the snapshot changed.
+    if not (
+        app.playback_album is app.current_album
+        and cached
+        and cached[0] is tracks
+        and cached[1] == len(tracks)
+        and cached[2] is app.playback_album_tracks
+    ):
+        app.playback_album = app.current_album
+        app.playback_album_tracks = [
+            track_utils.snapshot_track(item, track_utils.get_track_identity)
+            for item in tracks
+        ]
+        app._playback_snapshot_source = (
+            tracks,
+            len(tracks),
+            app.playback_album_tracks,
+        )
     app.start_playback_from_index(index, reset_queue=False)
     if not app.playback_remote_active:
         app.playback_queue_identity = None
@@ -46,11 +69,14 @@ def start_playback_from_index(app, index: int, reset_queue: bool) -> None:
     if index < 0 or index >= len(app.playback_album_tracks):
         return
     track_info = app.playback_album_tracks[index]
+    # A restart seek still waiting to go out would land on the new track.
+    _cancel_pending_seek(app)
     app.playback_track_index = index
     app.playback_track_info = track_info
     app.playback_track_identity = track_info["identity"]
+    now = time.monotonic()
     app.playback_elapsed = 0.0
-    app.playback_last_tick = time.monotonic()
+    app.playback_last_tick = now
     app.playback_duration = track_info.get("length_seconds", 0) or 0
     app.playback_remote_active = bool(
         track_info.get("source_uri") and app.server_url
@@ -58,15 +84,13 @@ def start_playback_from_index(app, index: int, reset_queue: bool) -> None:
     app.playback_pending = bool(
         app.playback_remote_active and _is_sendspin_output(app)
     )
-    app.playback_pending_since = (
-        time.monotonic() if app.playback_pending else None
-    )
+    app.playback_pending_since = now if app.playback_pending else None
     if app.playback_remote_active:
         app.ensure_remote_playback_sync()
     else:
         app.stop_remote_playback_sync()
-    if os.getenv("SENDSPIN_DEBUG"):
-        logging.getLogger(__name__).info(
+    if _DEBUG:
+        _logger.info(
             "Playback start: title=%s source_uri=%s remote=%s output=%s",
             track_info.get("title") or "Unknown Track",
             track_info.get("source_uri"),
@@ -76,12 +100,8 @@ def start_playback_from_index(app, index: int, reset_queue: bool) -> None:
             else None,
         )
     app.set_playback_state(PlaybackState.PLAYING)
-    app.update_now_playing()
-    if app.mpris_manager:
-        app.mpris_manager.notify_track_changed()
-    app.update_playback_progress_ui()
+    _mark_dirty(app, "progress", "now_playing", "highlight", "mpris_track")
     app.ensure_playback_timer()
-    app.sync_playback_highlight()
     if reset_queue:
         app.schedule_home_recently_played_refresh()
         app.queue_album_playback(index)
@@ -122,11 +142,36 @@ def restart_current_track(app) -> None:
     app.playback_elapsed = 0.0
     app.playback_last_tick = time.monotonic()
     app.update_playback_progress_ui()
-    app.send_playback_command("seek", position=0)
+    _schedule_seek(app, 0)
     if app.mpris_manager:
         app.mpris_manager.emit_mpris_seeked(0)
 
 
+def _schedule_seek(app, position: int) -> None:
+    # Repeated presses within the window collapse into one seek command.
+    app._pending_seek_position = position
+    if app._pending_seek_source is None:
+        app._pending_seek_source = GLib.timeout_add(
+            SEEK_DEBOUNCE_MS, _flush_seek, app
+        )
+
+
+def _cancel_pending_seek(app) -> None:
+    if app._pending_seek_source is not None:
+        GLib.source_remove(app._pending_seek_source)
+        app._pending_seek_source = None
+    app._pending_seek_position = None
+
+
+def _flush_seek(app) -> bool:
+    app._pending_seek_source = None
+    position = app._pending_seek_position
+    app._pending_seek_position = None
+    if position is not None:
+        app.send_playback_command("seek", position=position)
+    return False
+
+
 def sync_playback_highlight(app) -> None:
     if not app.current_album_tracks:
         return
@@ -145,33 +190,43 @@ def sync_playback_highlight(app) -> None:
             selection = app.playlist_tracks_selection
         elif visible == "favorites" and app.favorites_tracks_selection:
             selection = app.favorites_tracks_selection
-    for row in app.current_album_tracks:
-        row.is_playing = False
+    # Only one row is ever flagged, so clearing it is enough.
+    if app._highlighted_row is not None:
+        app._highlighted_row.is_playing = False
+        app._highlighted_row = None
     if not app.playback_track_identity:
         return
     if not app.is_same_album(app.current_album, app.playback_album):
         return
-    target_index = None
-    for index, row in enumerate(app.current_album_tracks):
-        source = getattr(row, "source", None)
-        source_uri = getattr(source, "uri", None) if source else None
-        if (
-            track_utils.get_track_identity(row, source_uri)
-            == app.playback_track_identity
-        ):
-            row.is_playing = True
-            target_index = index
-            break
-    if target_index is None or not selection:
+    target_index = _album_identity_index(app).get(app.playback_track_identity)
+    if target_index is None:
+        return
+    row = app.current_album_tracks[target_index]
+    row.is_playing = True
+    app._highlighted_row = row
+    if not selection:
         return
     app.suppress_track_selection = True
     selection.set_selected(target_index)
     app.suppress_track_selection = False
 
 
+def _album_identity_index(app) -> dict:
+    tracks = app.current_album_tracks
+    cached = app._album_identity_index
+    if cached and cached[0] is tracks and cached[1] == len(tracks):
+        return cached[2]
+    index = {}
+    for position, row in enumerate(tracks):
+        index.setdefault(track_utils.get_cached_track_identity(row), position)
+    app._album_identity_index = (tracks, len(tracks), index)
+    return index
+
+
 def stop_playback(app) -> None:
     if not app.playback_track_info and app.playback_state == PlaybackState.IDLE:
         return
+    _cancel_pending_seek(app)
     app.playback_track_info = None
     app.playback_track_identity = None
     app.playback_track_index = None
@@ -183,7 +238,6 @@ def stop_playback(app) -> None:
     app.playback_pending_since = None
     app.stop_remote_playback_sync()
     app.set_playback_state(PlaybackState.IDLE)
-    app.sync_playback_highlight()
     if app.album_tracks_selection:
         app.clear_track_selection(app.album_tracks_selection)
     if (
@@ -197,10 +251,36 @@ def stop_playback(app) -> None:
         and app.favorites_tracks_selection is not app.playlist_tracks_selection
     ):
         app.clear_track_selection(app.favorites_tracks_selection)
-    app.update_now_playing()
-    app.update_playback_progress_ui()
-    if app.mpris_manager:
-        app.mpris_manager.notify_track_changed()
+    _mark_dirty(app, "progress", "now_playing", "highlight", "mpris_track")
+
+
+_DIRTY_ORDER = ("progress", "now_playing", "highlight", "mpris_track")
+
+
+def _mark_dirty(app, *parts: str) -> None:
+    app._dirty.update(parts)
+    if not app._dirty_scheduled:
+        app._dirty_scheduled = True
+        GLib.idle_add(_flush_dirty, app)
+
+
+def _flush_dirty(app) -> bool:
+    dirty = app._dirty
+    app._dirty = set()
+    app._dirty_scheduled = False
+    # Highlight runs after now_playing so it sees the updated labels.
+    for part in _DIRTY_ORDER:
+        if part not in dirty:
+            continue
+        if part == "progress":
+            app.update_playback_progress_ui()
+        elif part == "now_playing":
+            app.update_now_playing()
+        elif part == "highlight":
+            app.sync_playback_highlight()
+        elif app.mpris_manager:
+            app.mpris_manager.notify_track_changed()
+    return False
 
 
 def set_playback_state(app, state: PlaybackState) -> None:
@@ -213,6 +293,8 @@ def set_playback_state(app, state: PlaybackState) -> None:
     if state == PlaybackState.PLAYING:
         app.playback_last_tick = time.monotonic()
         app.ensure_playback_timer()
+    else:
+        _stop_playback_timer(app)
     app.update_play_pause_icon()
     sidebar_playing_bars = getattr(app, "sidebar_playing_bars", None)
     sidebar_now_playing_art = getattr(app, "sidebar_now_playing_art", None)
@@ -242,32 +324,47 @@ def update_play_pause_icon(app) -> None:
 
 
 def ensure_playback_timer(app) -> None:
+    if app.playback_state != PlaybackState.PLAYING:
+        return
     if app.playback_timer_id is None:
-        app.playback_timer_id = GLib.timeout_add(250, app.on_playback_tick)
+        app.playback_timer_id = GLib.timeout_add_seconds(
+            1, app.on_playback_tick
+        )
+
+
+def _stop_playback_timer(app) -> None:
+    if app.playback_timer_id is not None:
+        GLib.source_remove(app.playback_timer_id)
+        app.playback_timer_id = None
 
 
 def on_playback_tick(app) -> bool:
-    if app.playback_track_info is None:
+    if (
+        app.playback_track_info is None
+        or app.playback_state != PlaybackState.PLAYING
+    ):
         app.playback_timer_id = None
         return False
-    if app.playback_state == PlaybackState.PLAYING:
-        now = time.monotonic()
-        if app.playback_last_tick is None:
+    now = time.monotonic()
+    if app.playback_last_tick is None:
+        app.playback_last_tick = now
+    if app.playback_pending:
+        if _is_playback_pending_grace(app, now):
             app.playback_last_tick = now
-        if getattr(app, "playback_pending", False):
-            if _is_playback_pending_grace(app):
-                app.playback_last_tick = now
-            else:
-                mark_playback_started(app)
-        if not getattr(app, "playback_pending", False):
-            delta = now - app.playback_last_tick
-            app.playback_elapsed += delta
-            app.playback_last_tick = now
-            if app.playback_duration:
-                app.playback_elapsed = min(
-                    app.playback_elapsed, float(app.playback_duration)
-                )
-    app.update_playback_progress_ui()
+        else:
+            mark_playback_started(app, now)
+    if not app.playback_pending:
+        delta = now - app.playback_last_tick
+        app.playback_elapsed += delta
+        app.playback_last_tick = now
+        if app.playback_duration:
+            app.playback_elapsed = min(
+                app.playback_elapsed, float(app.playback_duration)
+            )
+    # Labels only resolve whole seconds; remote sync and seeks render
+    # sub-second corrections themselves.
+    if int(app.playback_elapsed) != app._last_rendered_elapsed_s:
+        app.update_playback_progress_ui()
     return True
 
 
@@ -324,23 +421,24 @@ def _update_now_playing_provider(app) -> None:
         _apply_provider_badge(app, "", None, None)
         return
     source = app.playback_track_info.get("source")
-    logger = logging.getLogger(__name__)
-    track_title = app.playback_track_info.get("title") or "Unknown Track"
-    provider_key = _extract_provider_key(source)
-    mapping_count = len(_get_attr(source, "provider_mappings") or [])
-    logger.info(
-        "Now playing provider lookup: title=%s provider_key=%s mappings=%s",
-        track_title,
-        provider_key,
-        mapping_count,
-    )
-    manifest, domain = _resolve_provider_manifest(app, source)
-    if manifest is None:
-        logger.info(
-            "No provider manifest resolved: title=%s provider_key=%s",
+    debug = _logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        track_title = app.playback_track_info.get("title") or "Unknown Track"
+        provider_key = _extract_provider_key(source)
+        _logger.debug(
+            "Now playing provider lookup: title=%s provider_key=%s mappings=%s",
             track_title,
             provider_key,
+            len(_get_attr(source, "provider_mappings") or []),
         )
+    manifest, domain = _resolve_provider_manifest(app, source)
+    if manifest is None:
+        if debug:
+            _logger.debug(
+                "No provider manifest resolved: title=%s provider_key=%s",
+                track_title,
+                provider_key,
+            )
         _ensure_provider_manifests_loaded(app)
         _apply_provider_badge(app, "", None, None)
         return
@@ -350,19 +448,17 @@ def _update_now_playing_provider(app) -> None:
     if not label:
         label = ""
     svg_text = _pick_provider_svg(manifest)
-    texture = None
-    if svg_text:
-        cache_key = domain or _get_attr(manifest, "domain") or "provider"
-        texture = _get_cached_provider_texture(app, str(cache_key), svg_text)
+    texture = _get_cached_provider_texture(svg_text) if svg_text else None
     icon_name = None if texture else _get_attr(manifest, "icon")
-    logger.info(
-        "Resolved provider manifest: title=%s domain=%s name=%s icon=%s svg=%s",
-        track_title,
-        domain,
-        label or _get_attr(manifest, "name"),
-        icon_name,
-        bool(svg_text),
-    )
+    if debug:
+        _logger.debug(
+            "Resolved provider manifest: title=%s domain=%s name=%s icon=%s svg=%s",
+            track_title,
+            domain,
+            label or _get_attr(manifest, "name"),
+            icon_name,
+            bool(svg_text),
+        )
     _apply_provider_badge(app, label, texture, icon_name)
 
 
@@ -404,7 +500,7 @@ def _ensure_provider_manifests_loaded(app) -> None:
     instances = getattr(app, "provider_instances", None)
     if manifests and instances:
         return
-    logging.getLogger(__name__).info(
+    _logger.info(
         "Loading provider manifests: server=%s",
         app.server_url,
     )
@@ -417,22 +513,15 @@ def _ensure_provider_manifests_loaded(app) -> None:
 
 
 def _resolve_provider_manifest(app, source: object | None) -> tuple[object | None, str | None]:
-    manifests = getattr(app, "provider_manifests", None) or {}
-    if not manifests:
+    index = app.provider_manifest_by_any_key
+    if not index:
         return None, None
     provider_key = _extract_provider_key(source)
     if not provider_key:
         return None, None
-    if provider_key in manifests:
-        return manifests[provider_key], provider_key
-    instances = getattr(app, "provider_instances", None) or {}
-    instance = instances.get(provider_key)
-    if instance:
-        domain = _get_attr(instance, "domain")
-        if isinstance(domain, str):
-            domain = domain.strip()
-        if domain and domain in manifests:
-            return manifests[domain], domain
+    entry = index.get(provider_key)
+    if entry:
+        return entry
     mappings = _get_attr(source, "provider_mappings") or []
     for mapping in mappings:
         domain = _get_attr(mapping, "provider_domain") or _get_attr(
@@ -440,11 +529,27 @@ def _resolve_provider_manifest(app, source: object | None) -> tuple[object | Non
         )
         if isinstance(domain, str):
             domain = domain.strip()
-        if domain and domain in manifests:
-            return manifests[domain], domain
+        entry = index.get(domain) if domain else None
+        if entry:
+            return entry
     return None, None
 
 
+def _build_provider_manifest_index(app) -> dict:
+    manifests = app.provider_manifests
+    index = {}
+    for instance_id, instance in app.provider_instances.items():
+        domain = _get_attr(instance, "domain")
+        if isinstance(domain, str):
+            domain = domain.strip()
+        if domain and domain in manifests:
+            index[instance_id] = (manifests[domain], domain)
+    # Domains win over instance ids, matching the old lookup order.
+    for domain, manifest in manifests.items():
+        index[domain] = (manifest, domain)
+    return index
+
+
 def _extract_provider_key(source: object | None) -> str | None:
     if not source:
         return None
@@ -467,19 +572,11 @@ def _pick_provider_svg(manifest: object) -> str | None:
     return None
 
 
-def _get_cached_provider_texture(
-    app, cache_key: str, svg_text: str
-) -> object | None:
-    cache = getattr(app, "provider_icon_cache", None)
-    if cache is None:
-        app.provider_icon_cache = {}
-        cache = app.provider_icon_cache
-    if cache_key in cache:
-        return cache[cache_key]
-    texture = image_loader.load_svg_texture(svg_text)
-    if texture is not None:
-        cache[cache_key] = texture
-    return texture
+@functools.lru_cache(maxsize=64)
+def _get_cached_provider_texture(svg_text: str) -> object | None:
+    # Keyed by SVG content so identical icons across providers and
+    # manifest reloads share one texture.
+    return image_loader.load_svg_texture(svg_text)
 
 
 def _load_provider_manifests_worker(app) -> None:
@@ -513,12 +610,11 @@ def on_provider_manifests_loaded(
 ) -> None:
     app.provider_manifest_loading = False
     if error:
-        logging.getLogger(__name__).warning(
+        _logger.warning(
             "Provider manifest load failed: %s",
             error,
         )
         return
-    app.provider_icon_cache = {}
     app.provider_instances = {}
     app.provider_manifests = {}
     if isinstance(providers, list):
@@ -535,18 +631,19 @@ def on_provider_manifests_loaded(
                 domain = domain.strip()
             if domain:
                 app.provider_manifests[domain] = item
-    logging.getLogger(__name__).info(
+    app.provider_manifest_by_any_key = _build_provider_manifest_index(app)
+    _logger.debug(
         "Loaded provider details: instances=%s manifests=%s",
         len(app.provider_instances),
         len(app.provider_manifests),
     )
-    if app.provider_manifests:
+    if app.provider_manifests and _logger.isEnabledFor(logging.DEBUG):
         sample_domains = sorted(app.provider_manifests.keys())[:5]
-        logging.getLogger(__name__).debug(
+        _logger.debug(
             "Provider manifest domains: %s",
             sample_domains,
         )
-    app.update_now_playing()
+    _mark_dirty(app, "now_playing")
 
 
 def update_sidebar_now_playing_art(app) -> None:
@@ -650,9 +747,33 @@ def update_now_playing_art_thumb(app) -> None:
 
 
 def _resolve_now_playing_image_url(app) -> str | None:
-    image_url = None
-    album_image_url = _resolve_playback_album_image_url(app)
-    library_album_image_url = _resolve_library_album_image_url(app)
+    # Track info dicts are never mutated in place and the album lists are
+    # only ever reassigned, so identity checks are enough to reuse the
+    # result across the sidebar and thumbnail updates.
+    track_info = app.playback_track_info
+    playback_album = app.playback_album
+    library_albums = app.library_albums
+    cached = app._now_playing_image_cache
+    if (
+        cached
+        and cached[0] is track_info
+        and cached[1] is playback_album
+        and cached[2] is library_albums
+        and cached[3] == app.server_url
+    ):
+        return cached[4]
+    image_url = _compute_now_playing_image_url(app)
+    app._now_playing_image_cache = (
+        track_info,
+        playback_album,
+        library_albums,
+        app.server_url,
+        image_url,
+    )
+    return image_url
+
+
+def _compute_now_playing_image_url(app) -> str | None:
     if app.playback_track_info:
         candidate = app.playback_track_info.get("image_url")
         if isinstance(candidate, str):
@@ -663,22 +784,22 @@ def _resolve_now_playing_image_url(app) -> str | None:
             image_url = image_loader.resolve_image_url(
                 candidate, app.server_url
             )
-    if not image_url and album_image_url:
-        image_url = album_image_url
-    if not image_url and library_album_image_url:
-        image_url = library_album_image_url
-    if not image_url and app.playback_track_info:
+            if image_url:
+                return image_url
+    image_url = _resolve_playback_album_image_url(app)
+    if image_url:
+        return image_url
+    image_url = _resolve_library_album_image_url(app)
+    if image_url:
+        return image_url
+    if app.playback_track_info:
         source = app.playback_track_info.get("source")
         if source:
-            image_url = image_loader.extract_media_image_url(
+            return image_loader.extract_media_image_url(
                 source,
                 app.server_url,
             )
-    if not image_url and album_image_url:
-        image_url = album_image_url
-    if not image_url and library_album_image_url:
-        image_url = library_album_image_url
-    return image_url
+    return None
 
 
 def update_playback_progress_ui(app) -> None:
@@ -690,16 +811,26 @@ def update_playback_progress_ui(app) -> None:
         return
     elapsed = app.playback_elapsed if app.playback_track_info else 0
     duration = app.playback_duration if app.playback_track_info else 0
-    app.playback_time_current_label.set_label(
-        track_utils.format_timecode(elapsed)
-    )
-    app.playback_time_total_label.set_label(
-        track_utils.format_timecode(duration)
-    )
+    elapsed_s = int(elapsed)
+    duration_s = int(duration)
+    if elapsed_s != app._last_rendered_elapsed_s:
+        app._last_rendered_elapsed_s = elapsed_s
+        app.playback_time_current_label.set_label(
+            track_utils.format_timecode(elapsed_s)
+        )
+    if duration_s != app._last_rendered_duration_s:
+        app._last_rendered_duration_s = duration_s
+        app.playback_time_total_label.set_label(
+            track_utils.format_timecode(duration_s)
+        )
+    if app.seek_dragging:
+        return
     fraction = 0.0
     if duration:
         fraction = max(0.0, min(1.0, elapsed / duration))
-    if not getattr(app, "seek_dragging", False):
+    fraction_q = round(fraction * 1000)
+    if fraction_q != app._last_rendered_fraction_q:
+        app._last_rendered_fraction_q = fraction_q
         app.playback_seek_scale.set_value(fraction)
 
 
@@ -925,6 +1056,8 @@ def _stop_playback_listener(app) -> None:
     app._playback_listener_thread = None
     app._playback_listener_stop = None
     app._playback_listener_server = None
+    # Without the listener, remote volume changes go unnoticed.
+    playback.forget_sent_volumes()
     app._playback_listener_auth_token = None
 
 
@@ -934,8 +1067,9 @@ def _playback_listener_worker(
     auth_token: str,
     stop_event: threading.Event,
 ) -> None:
-    retry_delay = 1.0
+    retry_delay = _LISTENER_RETRY_MIN_SECONDS
     while not stop_event.is_set():
+        started = time.monotonic()
         try:
             asyncio.run(
                 app._playback_listener_async(
@@ -945,13 +1079,17 @@ def _playback_listener_worker(
                 )
             )
         except Exception as exc:
-            logging.getLogger(__name__).warning(
+            _logger.warning(
                 "Playback listener stopped: %s",
                 exc,
             )
         if stop_event.is_set():
             break
+        if time.monotonic() - started >= _LISTENER_RETRY_MAX_SECONDS:
+            # The connection held for a while; treat this as a fresh drop.
+            retry_delay = _LISTENER_RETRY_MIN_SECONDS
         stop_event.wait(retry_delay)
+        retry_delay = min(retry_delay * 2, _LISTENER_RETRY_MAX_SECONDS)
 
 
 def _handle_library_change_refresh(app) -> bool:
@@ -1012,7 +1150,7 @@ async def _playback_listener_async(
                         )
                         active_queue_id = _extract_queue_id(active_queue)
                     except Exception as exc:
-                        logging.getLogger(__name__).debug(
+                        _logger.debug(
                             "Active queue lookup failed for %s: %s",
                             preferred_player_id,
                             exc,
@@ -1034,6 +1172,9 @@ async def _playback_listener_async(
             if event_type != EventType.PLAYER_UPDATED:
                 return
             player_id = getattr(data, "player_id", None)
+            playback.note_player_volume(
+                player_id, getattr(data, "volume_level", None)
+            )
             if preferred_player_id and player_id != preferred_player_id:
                 return
             if not player_id:
@@ -1042,7 +1183,7 @@ async def _playback_listener_async(
             payload = _build_remote_playback_payload(queue, player_id)
             GLib.idle_add(app._apply_remote_playback_state, payload, "")
         except Exception as exc:
-            logging.getLogger(__name__).debug(
+            _logger.debug(
                 "Playback event handling failed: %s",
                 exc,
             )
@@ -1087,7 +1228,7 @@ async def _playback_listener_async(
         payload = _build_remote_playback_payload(queue, player_id)
         GLib.idle_add(app._apply_remote_playback_state, payload, "")
     except Exception as exc:
-        logging.getLogger(__name__).debug(
+        _logger.debug(
             "Initial playback listener state fetch failed: %s",
             exc,
         )
@@ -1177,7 +1318,7 @@ def _apply_remote_playback_state(
 ) -> bool:
     app.playback_sync_inflight = False
     if error:
-        logging.getLogger(__name__).debug(
+        _logger.debug(
             "Remote playback sync failed: %s",
             error,
         )
@@ -1203,6 +1344,7 @@ def _apply_remote_playback_state(
     shuffle_enabled = payload.get("shuffle_enabled")
     elapsed_value = _coerce_elapsed(elapsed)
     hold_elapsed = _should_hold_elapsed(app)
+    now = time.monotonic()
 
     if payload_queue_id:
         app.playback_queue_identity = payload_queue_id
@@ -1217,7 +1359,7 @@ def _apply_remote_playback_state(
     if current_item is None:
         if queue_state in ("playing", "paused"):
             return False
-        if _is_playback_pending_grace(app):
+        if _is_playback_pending_grace(app, now):
             return False
         if app.playback_track_info:
             app.stop_playback()
@@ -1267,43 +1409,38 @@ def _apply_remote_playback_state(
             app.playback_elapsed = 0.0
         else:
             app.playback_elapsed = elapsed_value or 0.0
-        app.playback_last_tick = time.monotonic()
+        app.playback_last_tick = now
         app.playback_remote_active = bool(
             track_info.get("source_uri") and app.server_url
         )
-        app.update_now_playing()
-        if app.mpris_manager:
-            app.mpris_manager.notify_track_changed()
-        app.update_playback_progress_ui()
-        app.sync_playback_highlight()
+        _mark_dirty(
+            app, "progress", "now_playing", "highlight", "mpris_track"
+        )
     else:
         if display_changed:
             app.playback_track_info = track_info
             duration_value = track_info.get("length_seconds", 0) or 0
             if duration_value > 0:
                 app.playback_duration = duration_value
-            app.update_now_playing()
-            if app.mpris_manager:
-                app.mpris_manager.notify_track_changed()
-            app.update_playback_progress_ui()
+            _mark_dirty(app, "progress", "now_playing", "mpris_track")
         if elapsed_value is not None and not hold_elapsed:
             app.playback_elapsed = elapsed_value
             if app.playback_state == PlaybackState.PLAYING:
-                app.playback_last_tick = time.monotonic()
-            app.update_playback_progress_ui()
+                app.playback_last_tick = now
+            _mark_dirty(app, "progress")
 
     if queue_state == "playing":
         app.set_playback_state(PlaybackState.PLAYING)
     elif queue_state == "paused":
         app.set_playback_state(PlaybackState.PAUSED)
-    if queue_state == "playing" and getattr(app, "playback_pending", False):
+    if queue_state == "playing" and app.playback_pending:
         can_mark_started = (
             not _is_sendspin_output(app)
-            or not _is_playback_pending_grace(app)
+            or not _is_playback_pending_grace(app, now)
             or bool(elapsed_value and elapsed_value > 0.0)
         )
         if can_mark_started:
-            mark_playback_started(app)
+            mark_playback_started(app, now)
 
     _apply_queue_mode_updates(app, repeat_mode, shuffle_enabled)
     app.ensure_playback_timer()
@@ -1323,9 +1460,16 @@ def _normalize_queue_state(state: object) -> str:
     if state is None:
         return ""
     value = getattr(state, "value", state)
-    text = str(value).casefold()
-    if text.startswith("playbackstate."):
-        return text.split(".", 1)[1]
+    return _normalize_queue_state_text(
+        value if type(value) is str else str(value)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_queue_state_text(value: str) -> str:
+    text = value.casefold()
+    if text.startswith(_PLAYBACK_STATE_PREFIX):
+        return text[len(_PLAYBACK_STATE_PREFIX):]
     return text
 
 
@@ -1344,13 +1488,13 @@ def _track_display_signature(track_info: dict) -> tuple:
     )
 
 
-def mark_playback_started(app) -> None:
-    if not getattr(app, "playback_pending", False):
+def mark_playback_started(app, now: float | None = None) -> None:
+    if not app.playback_pending:
         return
     app.playback_pending = False
     app.playback_pending_since = None
     if app.playback_state == PlaybackState.PLAYING:
-        app.playback_last_tick = time.monotonic()
+        app.playback_last_tick = time.monotonic() if now is None else now
     app.update_now_playing()
 
 
@@ -1363,23 +1507,30 @@ def _is_sendspin_output(app) -> bool:
 
 
 def _should_hold_elapsed(app) -> bool:
-    return bool(getattr(app, "playback_pending", False) and _is_sendspin_output(app))
+    return bool(app.playback_pending and _is_sendspin_output(app))
 
 
-def _is_playback_pending_grace(app) -> bool:
-    if not getattr(app, "playback_pending", False):
+def _is_playback_pending_grace(app, now: float | None = None) -> bool:
+    if not app.playback_pending:
         return False
-    pending_since = getattr(app, "playback_pending_since", None)
+    pending_since = app.playback_pending_since
     if pending_since is None:
         return False
-    return (time.monotonic() - pending_since) < PLAYBACK_PENDING_GRACE_SECONDS
+    if now is None:
+        now = time.monotonic()
+    return (now - pending_since) < PLAYBACK_PENDING_GRACE_SECONDS
 
 
 def _normalize_repeat_mode(value: object) -> str | None:
     if value is None:
         return None
     raw = getattr(value, "value", value)
-    text = str(raw).casefold()
+    return _normalize_repeat_mode_text(raw if type(raw) is str else str(raw))
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_repeat_mode_text(value: str) -> str | None:
+    text = value.casefold()
     if text.startswith("repeatmode."):
         text = text.split(".", 1)[1]
     if text in ("off", "none", "disabled"):
@@ -1398,7 +1549,14 @@ def _normalize_shuffle_enabled(value: object) -> bool | None:
         return value
     if isinstance(value, (int, float)):
         return bool(value)
-    text = str(value).casefold()
+    return _normalize_shuffle_text(
+        value if type(value) is str else str(value)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_shuffle_text(value: str) -> bool | None:
+    text = value.casefold()
     if text in ("true", "1", "yes", "on", "enabled"):
         return True
     if text in ("false", "0", "no", "off", "disabled"):
@@ -1792,8 +1950,8 @@ def queue_album_playback(
 ) -> None:
     if not app.playback_remote_active:
         app.playback_queue_identity = None
-        if os.getenv("SENDSPIN_DEBUG"):
-            logging.getLogger(__name__).info(
+        if _DEBUG:
+            _logger.info(
                 "Playback queue skipped: remote playback inactive."
             )
         return
@@ -1806,13 +1964,13 @@ def queue_album_playback(
             media = track_info.get("source_uri")
     if not media:
         app.playback_queue_identity = None
-        if os.getenv("SENDSPIN_DEBUG"):
-            logging.getLogger(__name__).info(
+        if _DEBUG:
+            _logger.info(
                 "Playback queue skipped: missing media payload."
             )
         return
-    if os.getenv("SENDSPIN_DEBUG"):
-        logging.getLogger(__name__).info(
+    if _DEBUG:
+        _logger.info(
             "Queueing playback: media=%s output=%s",
             media,
             app.output_manager.preferred_player_id
@@ -1845,12 +2003,12 @@ def _play_album_worker(
                     app.output_manager.preferred_player_id,
                 )
             except Exception as exc:
-                logging.getLogger(__name__).warning(
+                _logger.warning(
                     "Failed to disable shuffle for direct track play: %s",
                     exc,
                 )
-        if os.getenv("SENDSPIN_DEBUG"):
-            logging.getLogger(__name__).info(
+        if _DEBUG:
+            _logger.info(
                 "Starting remote playback: media=%s output=%s sendspin_connected=%s",
                 media,
                 app.output_manager.preferred_player_id
@@ -1880,14 +2038,14 @@ def _play_album_worker(
                     app.output_manager.preferred_player_id,
                 )
             except Exception as exc:
-                logging.getLogger(__name__).warning(
+                _logger.warning(
                     "Failed to restore shuffle after direct track play: %s",
                     exc,
                 )
     except Exception as exc:
         error = str(exc)
     if error:
-        logging.getLogger(__name__).warning("Playback start failed: %s", error)
+        _logger.warning("Playback start failed: %s", error)
 
 
 def send_playback_command(app, command: str, position: int | None = None) -> None:
@@ -1916,7 +2074,7 @@ def _playback_command_worker(app, command: str, position: int | None) -> None:
     except Exception as exc:
         error = str(exc)
     if error:
-        logging.getLogger(__name__).warning(
+        _logger.warning(
             "Playback command '%s' failed: %s",
             command,
             error,
@@ -1973,7 +2131,7 @@ def _playback_index_worker(app, index: int) -> None:
     except Exception as exc:
         error = str(exc)
     if error:
-        logging.getLogger(__name__).warning(
+        _logger.warning(
             "Playback index '%s' failed: %s",
             index,
             error,
@@ -2063,7 +2221,7 @@ def _apply_repeat_result(app, mode: str, error: str) -> bool:
         app.queue_repeat_mode = mode
     _update_repeat_button(app)
     if error:
-        logging.getLogger(__name__).warning(
+        _logger.warning(
             "Repeat mode update failed: %s",
             error,
         )
@@ -2093,7 +2251,7 @@ def _apply_shuffle_result(app, enabled: bool, error: str) -> bool:
         app.queue_shuffle_enabled = enabled
     _update_shuffle_button(app)
     if error:
-        logging.getLogger(__name__).warning(
+        _logger.warning(
             "Shuffle update failed: %s",
             error,
         )
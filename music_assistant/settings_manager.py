@@ -435,7 +435,7 @@ def connect_to_server(
         playlist_manager.populate_playlists_list(app, [])
         app.provider_manifests = {}
         app.provider_instances = {}
-        app.provider_icon_cache = {}
+        app.provider_manifest_by_any_key = {}
         app.provider_manifest_loading = False
 
     callbacks = {
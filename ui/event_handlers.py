@@ -263,6 +263,11 @@ def on_volume_drag_end(
     app, _gesture, _n_press: int, _x: float, _y: float
 ) -> None:
     app.volume_dragging = False
+    if app.volume_update_id is not None:
+        # Send the final level on release instead of waiting out the
+        # change timeout.
+        GLib.source_remove(app.volume_update_id)
+        app._apply_volume_change()
     if app.pending_volume_value is None and app.last_volume_value is not None:
         app.update_volume_slider(app.last_volume_value)
 
@@ -277,6 +282,7 @@ def on_seek_scale_changed(app, scale: Gtk.Scale) -> None:
     if not getattr(app, "seek_dragging", False):
         elapsed = max(0.0, min(float(duration), value * float(duration)))
         if app.playback_time_current_label:
+            app._last_rendered_elapsed_s = int(elapsed)
             app.playback_time_current_label.set_label(
                 track_utils.format_timecode(elapsed)
             )
@@ -291,6 +297,7 @@ def on_seek_drag_begin(
     app, _gesture, _n_press: int, _x: float, _y: float
 ) -> None:
     app.seek_dragging = True
+    app._last_rendered_fraction_q = None
 
 
 def on_seek_drag_end(
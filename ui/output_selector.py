@@ -50,7 +50,9 @@ def build_output_selector(app) -> Gtk.Widget:
     listbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
     listbox.set_activate_on_single_click(True)
     listbox.add_css_class("output-list")
-    listbox.connect("row-activated", app.on_output_target_activated)
+    app._output_row_handler_id = listbox.connect(
+        "row-activated", app.on_output_target_activated
+    )
     container.append(listbox)
 
     group_label = Gtk.Label(label="Group Players", xalign=0)
@@ -157,6 +157,19 @@ def get_track_identity(track: object, source_uri: str | None = None) -> tuple:
     return ("fallback", track.track_number, track.title, track.artist)
 
 
+def get_cached_track_identity(track: object) -> tuple:
+    source = getattr(track, "source", None)
+    cached = getattr(track, "_cached_identity", None)
+    if cached is not None and cached[0] is source:
+        return cached[1]
+    source_uri = getattr(source, "uri", None) if source else None
+    identity = get_track_identity(track, source_uri)
+    # Fallback identities read mutable row fields, so only cache URI ones.
+    if source_uri:
+        track._cached_identity = (source, identity)
+    return identity
+
+
 def snapshot_track(track: object, get_track_identity_fn) -> dict:
     source = getattr(track, "source", None)
     source_uri = getattr(source, "uri", None) if source else None